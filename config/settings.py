@@ -18,6 +18,7 @@ class Settings:
     SOLVER_TIME_BUDGET_SECONDS: float
     SOLVER_MAX_WORKERS: int | None
     OPTIMAL_FIRST_GUESS: str
+    SOLVER_MODE: str
 
     # Logging Configuration
     LOG_LEVEL: str
@@ -65,6 +66,7 @@ class Settings:
             SOLVER_TIME_BUDGET_SECONDS=get_float("SOLVER_TIME_BUDGET_SECONDS", 5.0),
             SOLVER_MAX_WORKERS=solver_max_workers,
             OPTIMAL_FIRST_GUESS=get_str("OPTIMAL_FIRST_GUESS", "SALET"),
+            SOLVER_MODE=get_str("SOLVER_MODE", "entropy"),
             LOG_LEVEL=get_str("LOG_LEVEL", "INFO"),
             LOG_FORMAT=get_str(
                 "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
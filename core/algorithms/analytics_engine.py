@@ -1,8 +1,12 @@
 """Advanced analytics engine for Wordle bot performance analysis."""
 
+import heapq
+import os
 import statistics
-from collections import defaultdict
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from logging import Logger
 from typing import Any, TypedDict
 
@@ -10,10 +14,16 @@ import numpy as np
 
 from core.algorithms.solver_engine import SolverEngine
 from core.algorithms.state_manager import GameStateManager
-from core.domain.models import EntropyCalculation
+from core.domain.models import PATTERN_STRINGS, EntropyCalculation, GuessResult
 from infrastructure.data.word_lexicon import WordLexicon
 from utils.logging_config import get_logger
 
+# Base-3 code for each of the 243 feedback patterns, inverse of the
+# PATTERN_STRINGS flyweight pool; lets counters live in dense arrays
+_PATTERN_TO_CODE: dict[str, int] = {
+    pattern: code for code, pattern in enumerate(PATTERN_STRINGS)
+}
+
 
 class PositionInsights(TypedDict):
     """Type definition for position insights."""
@@ -93,6 +103,26 @@ class AnalyticsEngine:
         self.lexicon: WordLexicon = WordLexicon()
         self.solver: SolverEngine = SolverEngine(time_budget_seconds=1.0)
         self.logger: Logger = get_logger(__name__)
+        # Entropy of a word against the full answer set is invariant per
+        # lexicon, so it is computed at most once per word
+        self._entropy_cache: dict[str, float] = {}
+        # Per-thread game manager reused across simulations; thread-local
+        # because analyze_word_difficulty runs sims from a thread pool
+        self._tls = threading.local()
+
+    @cached_property
+    def _sim_solver(self) -> SolverEngine:
+        """Fast solver shared by all analysis simulations."""
+        return SolverEngine(time_budget_seconds=0.5)
+
+    def _first_turn_seed(self) -> tuple[str, float]:
+        """Best opening guess and its entropy against the full answer set.
+
+        Turn 1 always faces the full answer set, so this is computed once per
+        analysis run and passed into every simulated game.
+        """
+        first_guess = self._sim_solver.find_best_guess(self.lexicon.answers, 1)
+        return first_guess, self._entropy_vs_answers(first_guess)
 
     def analyze_word_difficulty(
         self, words: list[str] | None = None, sample_size: int = 50
@@ -113,45 +143,63 @@ class AnalyticsEngine:
                 self.lexicon.answers, min(sample_size, len(self.lexicon.answers))
             )
 
-        difficulties: list[WordDifficulty] = []
-
-        for word in words:
-            self.logger.info(f"Analyzing difficulty of: {word}")
-
-            # Run multiple simulations for statistical significance
-            game_results: list[int] = []
-            entropy_profiles: list[list[float]] = []
-
-            for _ in range(5):  # 5 simulations per word
-                result = self._simulate_single_game(word)
-                if result["solved"]:
-                    game_results.append(result["turns_used"])
-                    entropy_profiles.append([g["entropy"] for g in result["guesses"]])
+        # Turn 1 is identical across all simulations; seed it once
+        first_guess, first_entropy = self._first_turn_seed()
+
+        # Each word's simulations are independent, so words are analyzed in
+        # parallel threads (NumPy releases the GIL in the solver kernels);
+        # map preserves input order so tie-breaking stays deterministic
+        workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            analyzed = executor.map(
+                lambda word: self._analyze_word(word, first_guess, first_entropy),
+                words,
+            )
+            difficulties = [d for d in analyzed if d is not None]
 
-            if game_results:
-                avg_guesses = statistics.mean(game_results)
-                success_rate = len(game_results) / 5
-                avg_entropy_profile = self._average_entropy_profile(entropy_profiles)
+        # Sort by difficulty (hardest first)
+        return sorted(difficulties, key=lambda x: x.difficulty_score, reverse=True)
 
-                # Calculate difficulty score (higher = more difficult)
-                difficulty_score = (
-                    (avg_guesses * 0.7)
-                    + ((1 - success_rate) * 10)
-                    + (avg_entropy_profile[0] * 0.1)
-                )
+    def _analyze_word(
+        self, word: str, first_guess: str, first_entropy: float
+    ) -> WordDifficulty | None:
+        """Run the per-word simulation batch and aggregate its difficulty.
 
-                difficulties.append(
-                    WordDifficulty(
-                        word=word,
-                        avg_guesses=avg_guesses,
-                        success_rate=success_rate,
-                        entropy_profile=avg_entropy_profile,
-                        difficulty_score=difficulty_score,
-                    )
-                )
+        Returns None when no simulation solved the word.
+        """
+        self.logger.info(f"Analyzing difficulty of: {word}")
+
+        # Run multiple simulations for statistical significance
+        game_results: list[int] = []
+        entropy_profiles: list[list[float]] = []
+
+        for _ in range(5):  # 5 simulations per word
+            result = self._simulate_single_game(word, first_guess, first_entropy)
+            if result["solved"]:
+                game_results.append(result["turns_used"])
+                entropy_profiles.append([g["entropy"] for g in result["guesses"]])
+
+        if not game_results:
+            return None
+
+        avg_guesses = statistics.mean(game_results)
+        success_rate = len(game_results) / 5
+        avg_entropy_profile = self._average_entropy_profile(entropy_profiles)
+
+        # Calculate difficulty score (higher = more difficult)
+        difficulty_score = (
+            (avg_guesses * 0.7)
+            + ((1 - success_rate) * 10)
+            + (avg_entropy_profile[0] * 0.1)
+        )
 
-        # Sort by difficulty (hardest first)
-        return sorted(difficulties, key=lambda x: x.difficulty_score, reverse=True)
+        return WordDifficulty(
+            word=word,
+            avg_guesses=avg_guesses,
+            success_rate=success_rate,
+            entropy_profile=avg_entropy_profile,
+            difficulty_score=difficulty_score,
+        )
 
     def analyze_position_patterns(self) -> list[PositionAnalysis]:
         """Analyze letter frequency and patterns by position.
@@ -161,23 +209,25 @@ class AnalyticsEngine:
         """
         position_analyses: list[PositionAnalysis] = []
 
-        for pos in range(5):
-            letter_counts: dict[str, int] = defaultdict(int)
-            total_words: int = len(self.lexicon.answers)
+        # Letter counting runs on the lexicon's pre-encoded uint8 ASCII matrix
+        # so each position is a single bincount instead of a Python word loop
+        answers_matrix = self.lexicon.answers_matrix
+        total_words: int = answers_matrix.shape[0]
 
-            # Count letter frequencies at each position
-            for word in self.lexicon.answers:
-                letter_counts[word[pos]] += 1
+        for pos in range(5):
+            counts = np.bincount(answers_matrix[:, pos], minlength=91)[65:91]
+            freqs = counts / total_words
+            present = np.flatnonzero(counts)
 
-            # Convert to frequencies
             letter_frequencies = {
-                letter: count / total_words for letter, count in letter_counts.items()
+                chr(65 + i): float(freqs[i]) for i in present
             }
 
-            # Calculate entropy contribution of this position
-            entropy_contrib = -sum(
-                freq * np.log2(freq) for freq in letter_frequencies.values() if freq > 0
-            )
+            # Entropy contribution of this position in one masked reduction;
+            # zero-frequency letters contribute exactly 0, as with entr()
+            plogp = np.zeros_like(freqs)
+            np.log2(freqs, out=plogp, where=freqs > 0)
+            entropy_contrib = float(-(freqs * plogp).sum())
 
             # Find common patterns
             common_patterns = [
@@ -224,9 +274,9 @@ class AnalyticsEngine:
                     )
                     combinations.append(((first_word, second_word), avg_entropy))
 
-        # Sort by average entropy
-        combinations.sort(key=lambda x: x[1], reverse=True)
-        return [combo[0] for combo in combinations[:10]]
+        # Top-K by average entropy without sorting the full pair list
+        top = heapq.nlargest(10, combinations, key=lambda x: x[1])
+        return [combo[0] for combo in top]
 
     def analyze_feedback_patterns(self) -> FeedbackAnalysis:
         """Analyze frequency and effectiveness of feedback patterns.
@@ -234,18 +284,27 @@ class AnalyticsEngine:
         Returns:
             Comprehensive feedback pattern analysis
         """
-        pattern_stats: dict[str, int] = defaultdict(int)
-        pattern_effectiveness: dict[str, list[float]] = defaultdict(list)
+        # Dense 243-slot counters indexed by base-3 pattern code instead of
+        # string-keyed dicts; per-pattern sample lists were only ever reduced
+        # to a mean, so running sums suffice
+        pattern_stats = np.zeros(243, dtype=np.int64)
+        reduction_sums = np.zeros(243)
+        reduction_counts = np.zeros(243, dtype=np.int64)
 
         # Sample games to analyze patterns
         sample_words: list[str] = self.lexicon.answers[:100]  # First 100 for speed
 
+        # Turn 1 is identical across all simulations; seed it once
+        first_guess, first_entropy = self._first_turn_seed()
+
         for word in sample_words:
-            game_result: GameResult = self._simulate_single_game(word)
+            game_result: GameResult = self._simulate_single_game(
+                word, first_guess, first_entropy
+            )
 
             for _i, guess_info in enumerate(game_result["guesses"]):
-                pattern: str = guess_info["pattern"]
-                pattern_stats[pattern] += 1
+                code: int = _PATTERN_TO_CODE[guess_info["pattern"]]
+                pattern_stats[code] += 1
 
                 # Effectiveness = reduction in possibilities
                 remaining_before = guess_info["remaining_before"]
@@ -255,27 +314,43 @@ class AnalyticsEngine:
                     reduction_ratio = (
                         remaining_before - remaining_after
                     ) / remaining_before
-                    pattern_effectiveness[pattern].append(reduction_ratio)
-
-        # Calculate average effectiveness per pattern
-        pattern_analysis: dict[str, dict[str, float | int]] = {}
-        for pattern, reductions in pattern_effectiveness.items():
-            if reductions:
-                pattern_analysis[pattern] = {
-                    "frequency": pattern_stats[pattern],
-                    "avg_effectiveness": statistics.mean(reductions),
-                    "total_occurrences": len(reductions),
-                }
+                    reduction_sums[code] += reduction_ratio
+                    reduction_counts[code] += 1
+
+        # Calculate average effectiveness per observed pattern; codes decode
+        # back to strings only for the returned mappings
+        eff_codes = np.flatnonzero(reduction_counts)
+        pattern_analysis: dict[str, dict[str, float | int]] = {
+            PATTERN_STRINGS[code]: {
+                "frequency": int(pattern_stats[code]),
+                "avg_effectiveness": float(
+                    reduction_sums[code] / reduction_counts[code]
+                ),
+                "total_occurrences": int(reduction_counts[code]),
+            }
+            for code in eff_codes
+        }
+
+        common_codes = np.flatnonzero(pattern_stats)
+        top_common = common_codes[
+            np.argsort(-pattern_stats[common_codes], kind="stable")[:10]
+        ]
+        top_effective = eff_codes[
+            np.argsort(
+                -(reduction_sums[eff_codes] / reduction_counts[eff_codes]),
+                kind="stable",
+            )[:10]
+        ]
 
         return {
-            "most_common_patterns": sorted(
-                pattern_stats.items(), key=lambda x: x[1], reverse=True
-            )[:10],
-            "most_effective_patterns": sorted(
-                pattern_analysis.items(),
-                key=lambda x: x[1]["avg_effectiveness"],
-                reverse=True,
-            )[:10],
+            "most_common_patterns": [
+                (PATTERN_STRINGS[code], int(pattern_stats[code]))
+                for code in top_common
+            ],
+            "most_effective_patterns": [
+                (PATTERN_STRINGS[code], pattern_analysis[PATTERN_STRINGS[code]])
+                for code in top_effective
+            ],
             "pattern_details": pattern_analysis,
         }
 
@@ -316,37 +391,63 @@ class AnalyticsEngine:
 
         return insights
 
-    def _simulate_single_game(self, target_word: str) -> GameResult:
-        """Simulate a single game for analysis."""
-        solver: SolverEngine = SolverEngine(
-            time_budget_seconds=0.5
-        )  # Fast for analysis
-        game_manager: GameStateManager = GameStateManager()
+    def _simulate_single_game(
+        self,
+        target_word: str,
+        first_guess: str | None = None,
+        first_entropy: float = 0.0,
+    ) -> GameResult:
+        """Simulate a single game for analysis.
+
+        Args:
+            target_word: Word the simulated game must solve
+            first_guess: Pre-computed opening guess; turn 1 always faces the
+                full answer set, so callers running many simulations compute
+                it once via _first_turn_seed and pass it in
+            first_entropy: Entropy of first_guess against the full answer set
+        """
+        # One fast solver is shared across simulations, and each worker
+        # thread keeps one game manager that is reset between games instead
+        # of rebuilding the manager (and its solver) per simulation
+        solver: SolverEngine = self._sim_solver
+        game_manager: GameStateManager | None = getattr(
+            self._tls, "game_manager", None
+        )
+        if game_manager is None:
+            game_manager = GameStateManager()
+            self._tls.game_manager = game_manager
+        else:
+            game_manager.reset_game()
 
         turn = 1
         guesses: list[GuessInfo] = []
 
         while not game_manager.is_game_over() and turn <= 6:
-            current_answers: list[str] = game_manager.get_possible_answers()
-
-            # Get best guess
-            best_guess = solver.find_best_guess(current_answers, turn)
+            # Read the state's list directly: the loop only inspects it and
+            # filtering replaces the list rather than mutating it, so the
+            # defensive copy get_possible_answers() makes is not needed here
+            current_answers: list[str] = game_manager.get_current_state().possible_answers
 
-            # Calculate entropy
+            # Get best guess; turn 1 reuses the pre-seeded opening move
             entropy: float
-            if len(current_answers) > 1:
-                entropy_calc: EntropyCalculation = solver.calculate_detailed_entropy(
-                    best_guess, current_answers
-                )
-                entropy = entropy_calc.entropy
+            if turn == 1 and first_guess is not None:
+                best_guess = first_guess
+                entropy = first_entropy
             else:
-                entropy = 0.0
+                best_guess = solver.find_best_guess(current_answers, turn)
+
+                # Calculate entropy
+                if len(current_answers) > 1:
+                    entropy_calc: EntropyCalculation = (
+                        solver.calculate_detailed_entropy(best_guess, current_answers)
+                    )
+                    entropy = entropy_calc.entropy
+                else:
+                    entropy = 0.0
 
             # Simulate feedback
             feedback_pattern = solver.simulate_feedback(best_guess, target_word)
 
-            from core.domain.models import GuessResult
-
             guess_result = GuessResult.from_api_response(best_guess, feedback_pattern)
 
             # Record guess details
@@ -375,35 +476,56 @@ class AnalyticsEngine:
     def _average_entropy_profile(
         self, entropy_profiles: list[list[float]]
     ) -> list[float]:
-        """Average entropy profiles across multiple games."""
+        """Average entropy profiles across multiple games.
+
+        Profiles have ragged lengths, so they are packed into a NaN-padded
+        matrix and averaged column-wise in one nanmean reduction.
+        """
         if not entropy_profiles:
             return []
 
         max_length = max(len(profile) for profile in entropy_profiles)
-        averaged: list[float] = []
+        padded = np.full((len(entropy_profiles), max_length), np.nan)
+        for i, profile in enumerate(entropy_profiles):
+            padded[i, : len(profile)] = profile
 
-        for i in range(max_length):
-            values = [profile[i] for profile in entropy_profiles if i < len(profile)]
-            if values:
-                averaged.append(statistics.mean(values))
+        return np.nanmean(padded, axis=0).tolist()
 
-        return averaged
+    def _entropy_vs_answers(self, word: str) -> float:
+        """Entropy of a word against the full answer set, memoized.
+
+        find_optimal_guess_combinations scores ~200 word pairs drawn from a
+        pool of ~30 unique words; caching collapses the repeated solver calls
+        to one per unique word.
+        """
+        entropy = self._entropy_cache.get(word)
+        if entropy is None:
+            entropy = self.solver.calculate_detailed_entropy(
+                word, self.lexicon.answers
+            ).entropy
+            self._entropy_cache[word] = entropy
+        return entropy
 
     def _get_high_entropy_words(self, n: int = 20) -> list[str]:
-        """Get top N words by entropy against full answer set."""
-        word_entropies: list[tuple[str, float]] = []
+        """Get top N words by entropy against full answer set.
 
-        for word in self.lexicon.allowed_guesses[:100]:  # Sample for speed
-            try:
-                entropy_calc = self.solver.calculate_detailed_entropy(
-                    word, self.lexicon.answers
-                )
-                word_entropies.append((word, entropy_calc.entropy))
-            except Exception:
-                continue
+        All sampled words go through the solver's batch entropy kernel in one
+        call — a single pass building the feedback partition histograms —
+        instead of a full per-word entropy scan each. The results seed the
+        per-word cache so combination scoring reuses them.
+        """
+        sample = self.lexicon.allowed_guesses[:100]  # Sample for speed
+        calcs = self.solver.calculate_detailed_entropy_batch(
+            sample, self.lexicon.answers, answers_matrix=self.lexicon.answers_matrix
+        )
+
+        word_entropies: list[tuple[str, float]] = []
+        for word, calc in zip(sample, calcs, strict=False):
+            self._entropy_cache.setdefault(word, calc.entropy)
+            word_entropies.append((word, calc.entropy))
 
-        word_entropies.sort(key=lambda x: x[1], reverse=True)
-        return [word for word, _ in word_entropies[:n]]
+        top = heapq.nlargest(n, word_entropies, key=lambda x: x[1])
+        return [word for word, _ in top]
 
     def _calculate_combination_entropy(
         self, first_word: str, second_word: str
@@ -411,16 +533,9 @@ class AnalyticsEngine:
         """Calculate average entropy for a two-word combination."""
         # Simplified calculation - would need full simulation for accuracy
         try:
-            first_entropy = self.solver.calculate_detailed_entropy(
-                first_word, self.lexicon.answers
-            ).entropy
+            first_entropy = self._entropy_vs_answers(first_word)
             # Approximate second word entropy (would need actual filtering)
-            second_entropy = (
-                self.solver.calculate_detailed_entropy(
-                    second_word, self.lexicon.answers
-                ).entropy
-                * 0.7
-            )
+            second_entropy = self._entropy_vs_answers(second_word) * 0.7
             return (first_entropy + second_entropy) / 2
         except Exception:
             return 0.0
@@ -468,59 +583,83 @@ class AnalyticsEngine:
         Returns:
             List of word difficulty analysis results
         """
-        # Group results by target word
-        word_stats: dict[str, dict[str, Any]] = {}
-
-        for result in game_results:
-            target_word = result.get("target_word", "unknown")
-            if target_word not in word_stats:
-                word_stats[target_word] = {
-                    "word": target_word,
-                    "games_played": 0,
-                    "games_solved": 0,
-                    "total_turns": 0,
-                    "total_time": 0.0,
-                    "turn_counts": [],
-                }
+        # Adapter over the array-based analysis for callers holding dicts;
+        # one pass over the results extracts all four columns
+        words: list[str] = []
+        solved: list[bool] = []
+        turns: list[int] = []
+        times: list[float] = []
+        for r in game_results:
+            words.append(r.get("target_word", "unknown"))
+            solved.append(bool(r.get("solved", False)))
+            turns.append(r.get("turns_used", 0))
+            times.append(r.get("simulation_time", 0.0))
+
+        return self.analyze_word_difficulty_from_arrays(
+            words=words, solved=solved, turns=turns, times=times
+        )
 
-            stats = word_stats[target_word]
-            stats["games_played"] += 1
-            if result.get("solved", False):
-                stats["games_solved"] += 1
-            stats["total_turns"] += result.get("turns_used", 0)
-            stats["total_time"] += result.get("simulation_time", 0.0)
-            stats["turn_counts"].append(result.get("turns_used", 0))
-
-        # Calculate difficulty metrics
-        difficulty_results = []
-        for word, stats in word_stats.items():
-            if stats["games_played"] == 0:
-                continue
-
-            success_rate = stats["games_solved"] / stats["games_played"]
-            avg_turns = stats["total_turns"] / stats["games_played"]
-            avg_time = stats["total_time"] / stats["games_played"]
-
-            # Calculate difficulty score (higher = more difficult)
-            # Based on success rate, average turns, and consistency
-            turn_variance = (
-                np.var(stats["turn_counts"]) if len(stats["turn_counts"]) > 1 else 0
-            )
-            difficulty_score = (
-                (1 - success_rate) * 10 + avg_turns + (turn_variance * 0.1)
-            )
+    def analyze_word_difficulty_from_arrays(
+        self,
+        words: list[str],
+        solved: list[bool],
+        turns: list[int],
+        times: list[float],
+    ) -> list[dict[str, Any]]:
+        """Analyze word difficulty from parallel per-game arrays.
 
-            difficulty_results.append(
-                {
-                    "word": word,
-                    "difficulty_score": round(difficulty_score, 2),
-                    "success_rate": round(success_rate, 3),
-                    "avg_turns": round(avg_turns, 2),
-                    "avg_time": round(avg_time, 2),
-                    "games_played": stats["games_played"],
-                    "turn_variance": round(turn_variance, 2),
-                }
-            )
+        Grouping and aggregation run as vectorized reductions over the
+        struct-of-arrays columns instead of per-dict accumulation.
+
+        Args:
+            words: Target word per game
+            solved: Whether each game was solved
+            turns: Turns used per game
+            times: Simulation time per game in seconds
+
+        Returns:
+            List of word difficulty analysis results, hardest first
+        """
+        if not words:
+            return []
+
+        word_arr = np.asarray(words, dtype=object)
+        solved_arr = np.asarray(solved, dtype=bool)
+        turns_arr = np.asarray(turns, dtype=np.float64)
+        times_arr = np.asarray(times, dtype=np.float64)
+
+        # Group by word once; all per-word sums are bincount reductions
+        unique_words, inverse = np.unique(word_arr, return_inverse=True)
+        games_played = np.bincount(inverse)
+        games_solved = np.bincount(inverse, weights=solved_arr)
+        total_turns = np.bincount(inverse, weights=turns_arr)
+        total_time = np.bincount(inverse, weights=times_arr)
+        total_turns_sq = np.bincount(inverse, weights=turns_arr * turns_arr)
+
+        success_rate = games_solved / games_played
+        avg_turns = total_turns / games_played
+        avg_time = total_time / games_played
+
+        # Population variance via E[x^2] - E[x]^2; single-game words score 0
+        turn_variance = np.maximum(total_turns_sq / games_played - avg_turns**2, 0.0)
+        turn_variance[games_played <= 1] = 0.0
+
+        # Difficulty score (higher = more difficult) based on success rate,
+        # average turns, and consistency
+        difficulty_score = (1 - success_rate) * 10 + avg_turns + turn_variance * 0.1
+
+        difficulty_results = [
+            {
+                "word": unique_words[i],
+                "difficulty_score": round(float(difficulty_score[i]), 2),
+                "success_rate": round(float(success_rate[i]), 3),
+                "avg_turns": round(float(avg_turns[i]), 2),
+                "avg_time": round(float(avg_time[i]), 2),
+                "games_played": int(games_played[i]),
+                "turn_variance": round(float(turn_variance[i]), 2),
+            }
+            for i in range(len(unique_words))
+        ]
 
         # Sort by difficulty (highest first)
         difficulty_results.sort(key=lambda x: x["difficulty_score"], reverse=True)
@@ -3,9 +3,12 @@
 import random
 import statistics
 import time
-from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
+import numpy as np
+
 from core.algorithms.solver_engine import SolverEngine
 from core.algorithms.state_manager import GameStateManager
 from core.domain.models import GuessResult
@@ -35,6 +38,7 @@ class BenchmarkEngine:
         num_games: int = 100,
         target_words: list[str] | None = None,
         show_progress: bool = True,
+        play_game: Callable[[str], dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Run comprehensive benchmark across multiple games.
 
@@ -42,12 +46,16 @@ class BenchmarkEngine:
             num_games: Number of games to play
             target_words: Specific words to test (if None, random selection)
             show_progress: Whether to show progress updates
+            play_game: Optional replacement for the per-game play function
+            (e.g. an online API runner); defaults to local simulation
 
         Returns:
             Comprehensive benchmark results
         """
         self.logger.info(f"Starting benchmark with {num_games} games")
 
+        play = play_game or self._play_single_game
+
         if show_progress:
             self.display.start_benchmark(num_games)
 
@@ -58,34 +66,43 @@ class BenchmarkEngine:
         else:
             target_words = target_words[:num_games]
 
-        # Run games
+        # Run games concurrently; each game builds its own solver and state
+        # manager, so workers only share the read-only lexicon
         results = []
         wins = 0
         total_guesses_for_wins = []
 
-        for i, target_word in enumerate(target_words):
-            try:
-                game_result = self._play_single_game(target_word)
+        workers = min(self.max_workers, max(1, len(target_words)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_word = {
+                executor.submit(play, target_word): target_word
+                for target_word in target_words
+            }
+
+            for completed, future in enumerate(as_completed(future_to_word), start=1):
+                target_word = future_to_word[future]
+                try:
+                    game_result = future.result()
+                except Exception as e:
+                    self.logger.error(
+                        f"Error in game {completed} with target '{target_word}': {e}"
+                    )
+                    continue
+
                 results.append(game_result)
 
                 if game_result["won"]:
                     wins += 1
                     total_guesses_for_wins.append(game_result["guesses_used"])
 
-                # Update progress
+                # Update progress from the collecting thread only
                 if show_progress:
                     avg_guesses = (
                         statistics.mean(total_guesses_for_wins)
                         if total_guesses_for_wins
                         else 0
                     )
-                    self.display.update_progress(i + 1, wins, avg_guesses)
-
-            except Exception as e:
-                self.logger.error(
-                    f"Error in game {i + 1} with target '{target_word}': {e}"
-                )
-                continue
+                    self.display.update_progress(completed, wins, avg_guesses)
 
         # Compile final results
         benchmark_results = self._compile_results(results, target_words)
@@ -104,30 +121,38 @@ class BenchmarkEngine:
         Returns:
             Game result dictionary
         """
-        game_start_time = time.time()
+        game_start_time = time.perf_counter()
 
-        # Initialize components for this game
+        # Initialize components for this game; sharing the solver lets the
+        # filter strategy reuse pattern codes cached by its entropy scans
         solver = SolverEngine(time_budget_seconds=self.solver_time_budget)
-        game_manager = GameStateManager()
+        game_manager = GameStateManager(solver=solver)
 
-        turn = 1
         guesses = []
 
-        while not game_manager.is_game_over() and turn <= 6:
-            turn_start_time = time.time()
+        for turn in range(1, 7):
+            if game_manager.is_game_over():
+                break
+            turn_start_time = time.perf_counter()
 
-            # Get current possible answers
-            current_answers = game_manager.get_possible_answers()
+            # Immutable snapshot; the solver's memo keys on this tuple
+            current_answers = game_manager.get_possible_answers_tuple()
 
             # Calculate best guess
             best_guess = solver.find_best_guess(current_answers, turn)
 
-            # Calculate entropy for analysis
+            # Entropy for analysis: find_best_guess already computed it for
+            # the chosen word, so reuse that instead of a second full scan;
+            # only paths that skipped the scan (e.g. turn 1) re-derive it
             if len(current_answers) > 1:
-                entropy_calc = solver.calculate_detailed_entropy(
-                    best_guess, current_answers
-                )
-                entropy = entropy_calc.entropy
+                cached_entropy = solver.last_entropy
+                if cached_entropy is not None:
+                    entropy = cached_entropy
+                else:
+                    entropy_calc = solver.calculate_detailed_entropy(
+                        best_guess, current_answers
+                    )
+                    entropy = entropy_calc.entropy
             else:
                 entropy = 0.0
 
@@ -138,7 +163,7 @@ class BenchmarkEngine:
             # Update game state
             game_manager.add_guess_result(guess_result)
 
-            turn_time = time.time() - turn_start_time
+            turn_time = time.perf_counter() - turn_start_time
 
             # Record guess details
             guesses.append(
@@ -153,9 +178,7 @@ class BenchmarkEngine:
                 }
             )
 
-            turn += 1
-
-        game_duration = time.time() - game_start_time
+        game_duration = time.perf_counter() - game_start_time
 
         return {
             "target_word": target_word,
@@ -178,67 +201,81 @@ class BenchmarkEngine:
         Returns:
             Compiled benchmark results
         """
-        wins = [r for r in results if r["won"]]
-        losses = [r for r in results if not r["won"]]
+        # Extract the scalar columns once and aggregate them vectorized
+        # instead of re-walking the result dicts per statistic
+        num_games = len(results)
+        won = np.fromiter((r["won"] for r in results), dtype=bool, count=num_games)
+        guesses_used = np.fromiter(
+            (r["guesses_used"] for r in results), dtype=np.int64, count=num_games
+        )
+        durations = np.fromiter(
+            (r["game_duration"] for r in results), dtype=np.float64, count=num_games
+        )
+
+        games_won = int(won.sum())
+        games_lost = num_games - games_won
+        win_rate = (games_won / num_games) * 100 if num_games else 0
+
+        win_guess_counts = guesses_used[won]
 
         # Guess distribution
-        distribution = defaultdict(int)
-        for result in wins:
-            guesses = result["guesses_used"]
-            distribution[f"{guesses}_guesses"] += 1
-        distribution["losses"] = len(losses)
-
-        # Calculate statistics
-        win_rate = (len(wins) / len(results)) * 100 if results else 0
-
-        guess_counts_wins = [r["guesses_used"] for r in wins]
-        avg_guesses = statistics.mean(guess_counts_wins) if guess_counts_wins else 0
-        median_guesses = (
-            statistics.median(guess_counts_wins) if guess_counts_wins else 0
-        )
+        distribution: dict[str, int] = {}
+        if games_won:
+            counts = np.bincount(win_guess_counts)
+            for guesses in np.flatnonzero(counts):
+                distribution[f"{guesses}_guesses"] = int(counts[guesses])
+        distribution["losses"] = games_lost
+
+        avg_guesses = float(win_guess_counts.mean()) if games_won else 0
+        median_guesses = float(np.median(win_guess_counts)) if games_won else 0
 
         # Timing statistics
-        game_durations = [r["game_duration"] for r in results]
-        avg_game_time = statistics.mean(game_durations) if game_durations else 0
+        avg_game_time = float(durations.mean()) if num_games else 0
 
         # Turn time analysis
-        all_turn_times = []
-        for result in results:
-            all_turn_times.extend([g["turn_time"] for g in result["guesses"]])
-        avg_turn_time = statistics.mean(all_turn_times) if all_turn_times else 0
+        all_turn_times = np.fromiter(
+            (g["turn_time"] for r in results for g in r["guesses"]), dtype=np.float64
+        )
+        avg_turn_time = float(all_turn_times.mean()) if all_turn_times.size else 0
 
         # Entropy analysis
-        all_entropies = []
-        for result in results:
-            all_entropies.extend(
-                [g["entropy"] for g in result["guesses"] if g["entropy"] > 0]
-            )
-        avg_entropy = statistics.mean(all_entropies) if all_entropies else 0
-
-        # Hardest words (most guesses among wins)
-        hardest_wins = sorted(wins, key=lambda x: x["guesses_used"], reverse=True)[:5]
+        all_entropies = np.fromiter(
+            (
+                g["entropy"]
+                for r in results
+                for g in r["guesses"]
+                if g["entropy"] > 0
+            ),
+            dtype=np.float64,
+        )
+        avg_entropy = float(all_entropies.mean()) if all_entropies.size else 0
 
-        # Easiest words (fewest guesses among wins)
-        easiest_wins = sorted(wins, key=lambda x: x["guesses_used"])[:5]
+        # Hardest words (most guesses among wins) and easiest (fewest);
+        # stable argsort preserves game order among ties like sorted() did
+        win_indices = np.flatnonzero(won)
+        hardest_wins = win_indices[
+            np.argsort(-win_guess_counts, kind="stable")[:5]
+        ]
+        easiest_wins = win_indices[np.argsort(win_guess_counts, kind="stable")[:5]]
 
         return {
-            "games_played": len(results),
-            "games_won": len(wins),
-            "games_lost": len(losses),
+            "games_played": num_games,
+            "games_won": games_won,
+            "games_lost": games_lost,
             "win_rate": win_rate,
             "avg_guesses": avg_guesses,
             "median_guesses": median_guesses,
-            "distribution": dict(distribution),
+            "distribution": distribution,
             "avg_game_time": avg_game_time,
             "avg_turn_time": avg_turn_time,
             "avg_entropy": avg_entropy,
             "hardest_words": [
-                (r["target_word"], r["guesses_used"]) for r in hardest_wins
+                (results[i]["target_word"], int(guesses_used[i])) for i in hardest_wins
             ],
             "easiest_words": [
-                (r["target_word"], r["guesses_used"]) for r in easiest_wins
+                (results[i]["target_word"], int(guesses_used[i])) for i in easiest_wins
             ],
-            "failed_words": [r["target_word"] for r in losses],
+            "failed_words": [results[i]["target_word"] for i in np.flatnonzero(~won)],
             "solver_time_budget": self.solver_time_budget,
             "target_words": target_words,
         }
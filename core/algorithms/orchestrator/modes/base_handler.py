@@ -4,10 +4,17 @@ This module provides the base class for all game mode handlers to reduce
 code duplication and ensure consistent behavior.
 """
 
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+
+import numpy as np
 
 from config.settings import Settings
 from core.algorithms.solver_engine import SolverEngine
+from core.algorithms.state_manager import ApiGameStateManager
+from core.domain.models import GuessResult
 from core.domain.types import GameSummary
 from infrastructure.data.word_lexicon import WordLexicon
 from utils.display import GameDisplay
@@ -37,6 +44,9 @@ class BaseGameHandler(ABC):
         self.display = display
         self.settings = settings
         self.logger = get_logger(self.__class__.__name__)
+        # One API game manager per worker thread, reset between games; batch
+        # sweeps run handlers from a thread pool
+        self._api_tls = threading.local()
 
     @abstractmethod
     def run_game(self) -> GameSummary:
@@ -47,13 +57,191 @@ class BaseGameHandler(ABC):
         """
         pass
 
+    def _pooled_api_manager(self) -> ApiGameStateManager:
+        """Return this thread's API game manager, reset for a fresh game.
+
+        Building a manager re-snapshots the answer list and constructs a
+        solver, so across a batch sweep each worker reuses one instance.
+        """
+        game_manager: ApiGameStateManager | None = getattr(
+            self._api_tls, "game_manager", None
+        )
+        if game_manager is None:
+            game_manager = ApiGameStateManager(app_settings=self.settings)
+            self._api_tls.game_manager = game_manager
+        else:
+            game_manager.reset_game()
+        return game_manager
+
+    def _identify_target(
+        self, initial_guess: str, expected_code: int, candidates: list[str]
+    ) -> str | None:
+        """Find a candidate consistent with the observed opener feedback.
+
+        The feedback a target would produce for the opener is deterministic,
+        so simulating it locally selects the same candidate the API probes
+        would — with zero network round trips.
+
+        Args:
+            initial_guess: The opening guess that produced the feedback
+            expected_code: Observed feedback as a packed base-3 code
+            candidates: Candidate answers, checked in order
+
+        Returns:
+            The first consistent candidate, or None
+        """
+        # Large candidate sets go through the vectorized code kernel (uint8
+        # letter arrays, one array pass); tiny sets stay scalar since the
+        # matrix setup would dominate
+        if len(candidates) >= 32:
+            codes = self.solver.feedback_codes_matrix([initial_guess], candidates)[0]
+            matches = np.flatnonzero(codes == expected_code)
+            return candidates[matches[0]] if matches.size else None
+
+        simulate_code = self.solver._simulate_feedback_code
+        for candidate in candidates:
+            if simulate_code(initial_guess, candidate) == expected_code:
+                return candidate
+        return None
+
+    def _run_target_loop(
+        self,
+        target_word: str,
+        game_manager: ApiGameStateManager,
+        submit_guess: Callable[[str], GuessResult],
+        *,
+        solved_label: str = "Target word",
+        max_turns: int = 6,
+    ) -> None:
+        """Drive the turn loop once the target word is known.
+
+        The daily and random modes converge on the same loop after target
+        identification; only the solved-log label differs, so both share
+        this implementation instead of maintaining two copies.
+
+        Args:
+            target_word: The identified target, used in the solved log
+            game_manager: State manager already seeded with turn-1 feedback
+            submit_guess: Submits a guess and returns its feedback
+            solved_label: Label used in the solved log message
+            max_turns: Maximum number of turns to play
+        """
+        for turn in range(2, max_turns + 1):
+            if game_manager.is_game_over():
+                break
+            # Immutable snapshot; the solver's memo keys on this tuple
+            current_answers = game_manager.get_possible_answers_tuple()
+
+            if len(current_answers) == 0:
+                self.logger.warning("No possible answers remaining")
+                break
+
+            if len(current_answers) == 1:
+                # Only one possible answer left
+                final_guess = current_answers[0]
+                self.logger.debug("Final guess: %s", final_guess)
+                try:
+                    final_result = submit_guess(final_guess)
+                    game_manager.add_guess_result(final_result)
+                    if self.display:
+                        self.display.show_feedback(final_result, 0)
+                    if final_result.is_correct:
+                        self.logger.info(
+                            "🎉 SOLVED! %s: %s in %d turns",
+                            solved_label,
+                            target_word,
+                            turn,
+                        )
+                    break
+                except Exception as e:
+                    self.logger.error(f"Error submitting final guess: {e}")
+                    break
+
+            # Use entropy algorithm to find best guess
+            best_guess = self.solver.find_best_guess(current_answers, turn)
+            # Per-turn progress is DEBUG with %-style args so argument
+            # formatting is skipped when the logger is filtered to INFO
+            self.logger.debug(
+                "Turn %d: Guessing '%s' from %d possible answers",
+                turn,
+                best_guess,
+                len(current_answers),
+            )
+
+            # Pipeline: warm the solver memo for the likeliest next states
+            # while the HTTP round trip is in flight
+            threading.Thread(
+                target=self._prefetch_next_guesses,
+                args=(best_guess, current_answers, turn + 1),
+                daemon=True,
+            ).start()
+
+            try:
+                guess_result = submit_guess(best_guess)
+                game_manager.add_guess_result(guess_result)
+                if self.display:
+                    self.display.show_feedback(
+                        guess_result, game_manager.get_remaining_answers_count()
+                    )
+                if guess_result.is_correct:
+                    self.logger.info(
+                        "🎉 SOLVED! %s: %s in %d turns",
+                        solved_label,
+                        target_word,
+                        turn,
+                    )
+                    break
+            except Exception as e:
+                self.logger.error(f"Error submitting guess: {e}")
+                break
+
+    def _prefetch_next_guesses(
+        self,
+        best_guess: str,
+        current_answers: Sequence[str],
+        next_turn: int,
+        top_k: int = 3,
+    ) -> None:
+        """Speculatively solve the likeliest next-turn states.
+
+        Runs while the submitted guess is waiting on the network: the
+        feedback partitions for the chosen guess are already known from the
+        entropy scan, so the largest (most probable) survivor sets can be
+        solved ahead of time. Results land in the solver's shared memo, so
+        when the real feedback arrives the next find_best_guess is a cache
+        hit — and a wrong speculation costs nothing but idle wait time.
+
+        Args:
+            best_guess: The guess currently in flight
+            current_answers: Candidate set the guess was chosen from
+            next_turn: Turn number the speculative states belong to
+            top_k: How many of the largest partitions to pre-solve
+        """
+        try:
+            codes = self.solver.get_cached_patterns(best_guess, list(current_answers))
+            if codes is None:
+                return
+            partitions: dict[int, list[str]] = defaultdict(list)
+            for word, code in zip(current_answers, codes):
+                partitions[code].append(word)
+            # Largest partitions are the most probable feedback outcomes;
+            # tiny ones resolve without a scan anyway
+            for survivors in sorted(partitions.values(), key=len, reverse=True)[
+                :top_k
+            ]:
+                if len(survivors) > 2:
+                    self.solver.find_best_guess(tuple(survivors), next_turn)
+        except Exception:
+            # Speculation is purely opportunistic; never let it surface
+            pass
+
     def _log_game_start(self, mode: str) -> None:
         """Log the start of a game.
 
         Args:
             mode: The game mode being played
         """
-        self.logger.info(f"Starting {mode} game")
+        self.logger.info("Starting %s game", mode)
 
     def _log_game_end(
         self, mode: str, solved: bool, turns: int, time_taken: float
@@ -67,7 +255,9 @@ class BaseGameHandler(ABC):
             time_taken: Time taken in seconds
         """
         status = "SOLVED" if solved else "FAILED"
-        self.logger.info(f"{mode} game {status} in {turns} turns ({time_taken:.2f}s)")
+        self.logger.info(
+            "%s game %s in %d turns (%.2fs)", mode, status, turns, time_taken
+        )
 
     def _log_turn_start(self, turn: int, remaining_answers: int) -> None:
         """Log the start of a turn.
@@ -76,7 +266,11 @@ class BaseGameHandler(ABC):
             turn: Current turn number
             remaining_answers: Number of remaining possible answers
         """
-        self.logger.info(f"Turn {turn}: {remaining_answers} possible answers remaining")
+        # Per-turn messages use deferred %-formatting so a filtered logger
+        # pays no string-building cost
+        self.logger.debug(
+            "Turn %d: %d possible answers remaining", turn, remaining_answers
+        )
 
     def _log_guess_selection(self, guess: str, calculation_time: float) -> None:
         """Log the selection of a guess.
@@ -85,7 +279,7 @@ class BaseGameHandler(ABC):
             guess: The selected guess
             calculation_time: Time taken to calculate the guess
         """
-        self.logger.info(f"Selected guess '{guess}' in {calculation_time:.2f}s")
+        self.logger.debug("Selected guess '%s' in %.2fs", guess, calculation_time)
 
     def _log_feedback(self, guess: str, feedback: str, correct: bool) -> None:
         """Log the feedback received.
@@ -95,7 +289,7 @@ class BaseGameHandler(ABC):
             feedback: The feedback pattern received
             correct: Whether the guess was correct
         """
-        self.logger.info(f"Guess '{guess}' -> {feedback} (Correct: {correct})")
+        self.logger.debug("Guess '%s' -> %s (Correct: %s)", guess, feedback, correct)
 
     def _log_fallback_strategy(self, guess: str) -> None:
         """Log the use of a fallback strategy.
@@ -103,7 +297,7 @@ class BaseGameHandler(ABC):
         Args:
             guess: The fallback guess selected
         """
-        self.logger.warning(f"Fallback strategy: using '{guess}' from full lexicon")
+        self.logger.warning("Fallback strategy: using '%s' from full lexicon", guess)
 
     def _log_no_possible_answers(self) -> None:
         """Log when no possible answers remain."""
@@ -3,12 +3,13 @@
 Handles offline game simulation logic.
 """
 
+import threading
 import time
 
 from config.settings import Settings
 from core.algorithms.solver_engine import SolverEngine
 from core.algorithms.state_manager import GameStateManager
-from core.domain.models import EntropyCalculation
+from core.domain.models import EntropyCalculation, GuessResult
 from core.domain.types import SimulationResult
 from infrastructure.data.word_lexicon import WordLexicon
 from utils.display import GameDisplay
@@ -27,6 +28,29 @@ class OfflineHandler(BaseGameHandler):
         settings: Settings,
     ) -> None:
         super().__init__(solver, lexicon, display, settings)
+        # One game manager per worker thread, reset between games; batch
+        # sweeps run this handler from a thread pool
+        self._tls = threading.local()
+
+    def _pooled_game_manager(self) -> GameStateManager:
+        """Return this thread's game manager, reset for a fresh game.
+
+        Building a manager re-snapshots the answer list and constructs a
+        solver, so across a batch sweep each worker reuses one instance.
+        """
+        game_manager: GameStateManager | None = getattr(
+            self._tls, "game_manager", None
+        )
+        if game_manager is None:
+            # Share this handler's solver so the filter strategy can reuse
+            # pattern codes cached by its entropy scans
+            game_manager = GameStateManager(
+                app_settings=self.settings, solver=self.solver
+            )
+            self._tls.game_manager = game_manager
+        else:
+            game_manager.reset_game()
+        return game_manager
 
     def run_game(
         self, target_answer: str, game_id: str | None = None
@@ -35,7 +59,7 @@ class OfflineHandler(BaseGameHandler):
         if not self.lexicon.is_valid_answer(target_answer):
             raise ValueError(f"'{target_answer}' is not a valid answer word")
 
-        self.logger.info(f"Simulating game with target answer: {target_answer}")
+        self.logger.info("Simulating game with target answer: %s", target_answer)
 
         # Initialize display if enabled
         if self.display:
@@ -43,12 +67,16 @@ class OfflineHandler(BaseGameHandler):
             self.display.start_new_game(game_id or f"sim_{target_answer}")
 
         # Initialize local game state (no API calls)
-        game_manager = GameStateManager()
-        simulation_start = time.time()
+        game_manager = self._pooled_game_manager()
+        # Durations use the monotonic clock; time.time() is kept only for
+        # the human-facing timestamp field
+        simulation_start = time.perf_counter()
 
-        turn = 1
-        while not game_manager.is_game_over() and turn <= 6:
-            current_answers = game_manager.get_possible_answers()
+        for turn in range(1, 7):
+            if game_manager.is_game_over():
+                break
+            # Immutable snapshot; the solver's memo keys on this tuple
+            current_answers = game_manager.get_possible_answers_tuple()
 
             # Show thinking process
             if self.display:
@@ -56,22 +84,39 @@ class OfflineHandler(BaseGameHandler):
                     f"Analyzing {len(current_answers)} possible answers..."
                 )
 
-            # Get best guess with timing
-            guess_start_time: float = time.time()
-            guess: str = self.solver.find_best_guess(
-                possible_answers=current_answers, turn=turn
-            )
-            calculation_time: float = time.time() - guess_start_time
+            # Get best guess with timing; with two or fewer survivors the
+            # first candidate is optimal in expectation, so skip the solver
+            guess_start_time: float = time.perf_counter()
+            if len(current_answers) <= 2 and current_answers:
+                guess: str = current_answers[0]
+                # No scan ran, so the solver's cached entropy is stale
+                self.solver.last_entropy = None
+                self.logger.debug(
+                    "Trivial state: guessing '%s' from %d candidates",
+                    guess,
+                    len(current_answers),
+                )
+            else:
+                guess = self.solver.find_best_guess(
+                    possible_answers=current_answers, turn=turn
+                )
+            calculation_time: float = time.perf_counter() - guess_start_time
 
-            # Calculate entropy for display
+            # Entropy for display: find_best_guess already computed it for
+            # the chosen word, so reuse that instead of a second pass; only
+            # paths that skipped the scan (e.g. turn 1) re-derive it
             entropy: float = 0.0
             if len(current_answers) > 1 and self.display and self.display.show_detailed:
-                entropy_calc: EntropyCalculation = (
-                    self.solver.calculate_detailed_entropy(
-                        guess_word=guess, possible_answers=current_answers
+                cached_entropy = self.solver.last_entropy
+                if cached_entropy is not None:
+                    entropy = cached_entropy
+                else:
+                    entropy_calc: EntropyCalculation = (
+                        self.solver.calculate_detailed_entropy(
+                            guess_word=guess, possible_answers=current_answers
+                        )
                     )
-                )
-                entropy = entropy_calc.entropy
+                    entropy = entropy_calc.entropy
 
             # Show guess submission
             if self.display:
@@ -89,8 +134,6 @@ class OfflineHandler(BaseGameHandler):
             )
 
             # Create guess result
-            from core.domain.models import GuessResult
-
             guess_result = GuessResult.from_api_response(guess, feedback_pattern)
 
             # Update state
@@ -102,11 +145,11 @@ class OfflineHandler(BaseGameHandler):
                     guess_result, game_manager.get_remaining_answers_count()
                 )
 
-            self.logger.info(msg=f"Turn {turn}: {guess} -> {feedback_pattern}")
-
-            turn += 1
+            # Per-turn detail is DEBUG with %-style args so batch sweeps pay
+            # no formatting cost when the logger is filtered to INFO
+            self.logger.debug("Turn %d: %s -> %s", turn, guess, feedback_pattern)
 
-        simulation_time = time.time() - simulation_start
+        simulation_time = time.perf_counter() - simulation_start
 
         # Show final result
         if self.display:
@@ -129,8 +172,9 @@ class OfflineHandler(BaseGameHandler):
                 "final_answer": target_answer if solved else None,
             },
             "performance_metrics": {
-                "total_game_time_seconds": round(simulation_time, 2),
-                "average_time_per_turn": round(simulation_time / max(1, turns_used), 2),
+                # Stored un-rounded; consumers round at display/serialization
+                "total_game_time_seconds": simulation_time,
+                "average_time_per_turn": simulation_time / max(1, turns_used),
                 "remaining_possibilities": game_summary["possible_answers"],
             },
             "guess_history": game_summary["guesses"],
@@ -7,7 +7,6 @@ import time
 
 from config.settings import Settings
 from core.algorithms.solver_engine import SolverEngine
-from core.algorithms.state_manager import ApiGameStateManager
 from core.domain.types import SimulationResult
 from infrastructure.api.game_client import GameClient
 from infrastructure.data.word_lexicon import WordLexicon
@@ -36,24 +35,39 @@ class WordHandler(BaseGameHandler):
             self.display.print_header()
             self.display.start_new_game(f"word_{target_answer}")
 
-        game_manager = ApiGameStateManager()
-        start = time.time()
-        turn = 1
+        game_manager = self._pooled_api_manager()
+        # Durations use the monotonic clock; time.time() is kept only for
+        # the human-facing timestamp field
+        start = time.perf_counter()
 
-        while not game_manager.is_game_over() and turn <= 6:
-            current_answers = game_manager.get_possible_answers()
-            guess = self.solver.find_best_guess(current_answers, turn)
+        for turn in range(1, 7):
+            if game_manager.is_game_over():
+                break
+            # Immutable snapshot; the solver's memo keys on this tuple
+            current_answers = game_manager.get_possible_answers_tuple()
+            # With two or fewer survivors the first candidate is optimal in
+            # expectation; skip the solver
+            if len(current_answers) <= 2 and current_answers:
+                guess = current_answers[0]
+                self.logger.debug(
+                    "Trivial state: guessing '%s' from %d candidates",
+                    guess,
+                    len(current_answers),
+                )
+            else:
+                guess = self.solver.find_best_guess(current_answers, turn)
             guess_result = self.client.submit_word_target_guess(target_answer, guess)
             game_manager.add_guess_result(guess_result)
             if self.display:
                 self.display.show_feedback(
                     guess_result, game_manager.get_remaining_answers_count()
                 )
-            turn += 1
 
         summary = game_manager.get_game_summary()
         solved = game_manager.is_solved()
         turns_used = len(game_manager.get_current_state().guesses)
+        # Stored un-rounded; consumers round at display/serialization
+        elapsed = time.perf_counter() - start
 
         return {
             "game_result": {
@@ -63,10 +77,8 @@ class WordHandler(BaseGameHandler):
                 "final_answer": target_answer if solved else None,
             },
             "performance_metrics": {
-                "total_game_time_seconds": round(time.time() - start, 2),
-                "average_time_per_turn": round(
-                    (time.time() - start) / max(1, turns_used), 2
-                ),
+                "total_game_time_seconds": elapsed,
+                "average_time_per_turn": elapsed / max(1, turns_used),
                 "remaining_possibilities": summary["possible_answers"],
             },
             "guess_history": summary["guesses"],
@@ -18,14 +18,9 @@ from core.services.game_summary_service import GameSummaryService
 from core.services.guess_analysis_service import GuessAnalysis, GuessAnalysisService
 from infrastructure.api.game_client import GameClient
 from infrastructure.data.word_lexicon import WordLexicon
-from utils.display import GameDisplay
+from utils.display import GameDisplay, QueuedGameDisplay
 from utils.logging_config import get_logger
 
-from .modes.daily_handler import DailyHandler
-from .modes.offline_handler import OfflineHandler
-from .modes.random_handler import RandomHandler
-from .modes.word_handler import WordHandler
-
 # GuessAnalysis moved to core.services.guess_analysis_service
 
 
@@ -62,43 +57,19 @@ class Orchestrator:
         )
         self.game_state_manager: GameStateManager | None = None
 
-        # Initialize display
+        # Initialize display; the queued variant renders from a background
+        # thread so console I/O overlaps with solver compute
         self.show_rich_display: bool = show_rich_display
         self.display: GameDisplay | None = (
-            GameDisplay(show_detailed=show_detailed) if show_rich_display else None
+            QueuedGameDisplay(show_detailed=show_detailed)
+            if show_rich_display
+            else None
         )
 
-        # Initialize services
+        # Initialize services; mode handlers are created lazily by the
+        # GameCoordinator on first use
         self._initialize_services()
 
-        # Initialize mode handlers
-        self._handlers = {
-            "daily": DailyHandler(
-                self.game_client,
-                self.solver_engine,
-                self.lexicon,
-                self.display,
-                self.settings,
-            ),
-            "random": RandomHandler(
-                self.game_client,
-                self.solver_engine,
-                self.lexicon,
-                self.display,
-                self.settings,
-            ),
-            "word": WordHandler(
-                self.game_client,
-                self.solver_engine,
-                self.lexicon,
-                self.display,
-                self.settings,
-            ),
-            "offline": OfflineHandler(
-                self.solver_engine, self.lexicon, self.display, self.settings
-            ),
-        }
-
         self.logger.info(
             msg=f"Orchestrator initialized with {len(self.lexicon.answers)} possible answers"
         )
@@ -140,7 +111,22 @@ class Orchestrator:
         3. Use Word-target API to continue with entropy algorithm
         4. Continue until solved or max turns reached
         """
-        return self.game_coordinator.solve_daily_puzzle()
+        summary = self.game_coordinator.solve_daily_puzzle()
+        self._flush_display()
+        return summary
+
+    def _flush_display(self) -> None:
+        """Wait for any queued display events to finish rendering."""
+        if isinstance(self.display, QueuedGameDisplay):
+            self.display.flush()
+
+    def close(self) -> None:
+        """Release the shared HTTP session and its pooled connections.
+
+        Called once per orchestrator lifetime; closing between games would
+        discard the warm keep-alive connections that benchmark runs rely on.
+        """
+        self.game_client.close()
 
     # _generate_daily_final_summary moved to GameSummaryService
 
@@ -164,6 +150,20 @@ class Orchestrator:
         """
         return self.game_coordinator.analyze_guess(guess, possible_answers)
 
+    def analyze_guesses(
+        self, guesses: list[str], possible_answers: list[str] | None = None
+    ) -> list[GuessAnalysis]:
+        """Analyze the entropy and effectiveness of many guesses in one batch.
+
+        Args:
+            guesses: The words to analyze
+            possible_answers: Optional list of possible answers. If None, uses all answers.
+
+        Returns:
+            Analysis results aligned with guesses
+        """
+        return self.game_coordinator.analyze_guesses(guesses, possible_answers)
+
     def play_random_game(self) -> SimulationResult:
         """Play a game using the random API mode (/random).
 
@@ -172,11 +172,15 @@ class Orchestrator:
         2. Use our entropy algorithm to solve that specific target word
         3. Continue until solved or max turns reached
         """
-        return self.game_coordinator.play_random_game()
+        result = self.game_coordinator.play_random_game()
+        self._flush_display()
+        return result
 
     def play_word_target(self, target_answer: str) -> SimulationResult:
         """Play a game against a specific target using /word/{target}."""
-        return self.game_coordinator.play_word_target(target_answer)
+        result = self.game_coordinator.play_word_target(target_answer)
+        self._flush_display()
+        return result
 
     def simulate_game(
         self, target_answer: str, game_id: str | None = None
@@ -190,7 +194,23 @@ class Orchestrator:
         Returns:
             Simulation results
         """
-        return self.game_coordinator.simulate_game(target_answer, game_id)
+        result = self.game_coordinator.simulate_game(target_answer, game_id)
+        self._flush_display()
+        return result
+
+    def simulate_games(
+        self, target_answers: list[str], max_workers: int | None = None
+    ) -> list[SimulationResult]:
+        """Simulate many games in parallel against known target answers.
+
+        Args:
+            target_answers: Target words, one game each
+            max_workers: Thread count (default: CPU count, capped at 8)
+
+        Returns:
+            Simulation results aligned with target_answers
+        """
+        return self.game_coordinator.simulate_games(target_answers, max_workers)
 
     def run_online_benchmark(
         self,
@@ -1,26 +1,50 @@
 """SolverEngine - Core entropy-maximization algorithm for Wordle solving."""
 
-import math
 import os
+import pickle
+import threading
 import time
+from pathlib import Path
 from collections import defaultdict
+from collections.abc import Sequence
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Final
 
 import numpy as np
 
 from config.settings import Settings
 from config.settings import settings as default_settings
 from core.domain.constants import TIME_BUDGET_BUFFER, WORD_LENGTH
-from core.domain.models import EntropyCalculation
+from core.domain.models import PATTERN_STRINGS, EntropyCalculation
 from infrastructure.data.word_lexicon import WordLexicon
 from utils.logging_config import get_logger
 
+# All 243 feedback patterns indexed by base-3 code (2=correct, 1=present,
+# 0=absent, least-significant digit first), shared with the domain models'
+# flyweight pool so every simulated pattern is one of those objects
+_CODE_TO_PATTERN: Final = PATTERN_STRINGS
+
+# Powers of three for packing the five feedback digits, hoisted out of the
+# per-pair simulation loops
+_POW3: Final = (1, 3, 9, 27, 81)
+
+# On-disk turn-2 table: with a fixed opener there are only 243 possible
+# feedback codes, each mapping to one optimal second guess. Persisting the
+# mapping lets later runs skip the turn-2 entropy scan entirely.
+_TURN2_CACHE_PATH: Final = Path.home() / ".cache" / "wordle-bot" / "turn2.pkl"
+
 
 class SolverEngine:
     """Core solver using information-theoretic approach with entropy maximization."""
 
     OPTIMAL_FIRST_GUESS: str = "SALET"  # Default, can be overridden by settings
 
+    # Best-guess memo shared by all engines running the same solver mode;
+    # dict operations are atomic under the GIL, so threaded sweeps are safe
+    _shared_best_guess_caches: dict[
+        str, dict[tuple[str, ...], tuple[str, float | None]]
+    ] = {}
+
     def __init__(
         self,
         time_budget_seconds: float = 5.0,
@@ -50,16 +74,55 @@ class SolverEngine:
         self._all_guesses: np.ndarray = np.array(self.lexicon.allowed_guesses)
         self._all_answers: np.ndarray = np.array(self.lexicon.answers)
 
-    def find_best_guess(self, possible_answers: list[str], turn: int = 1) -> str:
+        # Pattern codes computed for the most recent best guess, reusable by
+        # filter strategies to avoid re-simulating feedback for the candidates
+        self._fused_pattern_cache: tuple[str, list[str], list[int]] | None = None
+
+        # Feedback signatures for hot opening guesses against the full
+        # answer list, computed once per guess on first use
+        self._opener_signatures: dict[str, np.ndarray] = {}
+        self._full_answers: list[str] = self.lexicon.answers
+
+        # Best guess per candidate state: with a fixed opener, the same
+        # turn-2+ states recur constantly across benchmark games, so replays
+        # skip the entropy scan entirely. Bounded to keep memory flat.
+        # Shared per solver mode across engine instances — each state
+        # manager constructs its own engine, and the scan result depends
+        # only on the candidate set and the mode.
+        self._best_guess_cache: dict[tuple[str, ...], tuple[str, float | None]] = (
+            self._shared_best_guess_caches.setdefault(self.settings.SOLVER_MODE, {})
+        )
+
+        # Turn-2 results for this opener, keyed by the opener's feedback
+        # code; loaded from disk on first use and persisted as misses are
+        # filled in. Guarded by a lock since games may run from worker threads.
+        self._turn2_table: dict[int, tuple[str, float, int]] | None = None
+        self._turn2_lock = threading.Lock()
+
+        # Entropy of the guess returned by the latest find_best_guess call,
+        # or None when that path did not compute one (turn-1 shortcut,
+        # tiny candidate sets, minimax). Lets display paths reuse the value
+        # instead of re-deriving it with calculate_detailed_entropy.
+        self.last_entropy: float | None = None
+
+        # Whether the latest minimax scan hit its time budget; truncated
+        # scans are excluded from the shared memo
+        self._last_minimax_truncated: bool = False
+
+    def find_best_guess(self, possible_answers: Sequence[str], turn: int = 1) -> str:
         """Find the best guess using entropy maximization.
 
         Args:
-            possible_answers: Current list of possible answer words
+            possible_answers: Current possible answer words; passing a tuple
+            makes the memo key construction free
             turn: Current turn number (1-6)
 
         Returns:
             The optimal guess word
         """
+        # Cleared first so early returns never leave a stale value behind
+        self.last_entropy = None
+
         # Use pre-computed first guess
         if turn == 1:
             return self.OPTIMAL_FIRST_GUESS
@@ -77,48 +140,307 @@ class SolverEngine:
         if len(possible_answers) <= 2:
             return possible_answers[0]
 
+        # Replayed candidate states resolve from the memo without scanning
+        state_key = tuple(possible_answers)
+        cached_best = self._best_guess_cache.get(state_key)
+        if cached_best is not None:
+            self.last_entropy = cached_best[1]
+            return cached_best[0]
+
+        # Optional Knuth-style worst-case mode selected via settings
+        if self.settings.SOLVER_MODE == "minimax":
+            best = self.find_best_guess_minimax(possible_answers)
+            self.last_entropy = None
+            # Same completeness rule as the entropy path: only full scans
+            # may populate the shared memo
+            if (
+                not self._last_minimax_truncated
+                and len(self._best_guess_cache) < 4096
+            ):
+                self._best_guess_cache[state_key] = (best, None)
+            return best
+
+        # Turn 2 after the fixed opener is one of only 243 states; the
+        # persisted table resolves it across runs without a scan. Any
+        # survivor's feedback against the opener is the observed code, and
+        # the candidate count guards against permissive (API) filtering
+        # producing a different subset for the same code.
+        turn2_code: int | None = None
+        if turn == 2:
+            turn2_code = self._simulate_feedback_code(
+                self.OPTIMAL_FIRST_GUESS, possible_answers[0]
+            )
+            stored = self._load_turn2_table().get(turn2_code)
+            if stored is not None and stored[2] == len(possible_answers):
+                self.last_entropy = stored[1]
+                if len(self._best_guess_cache) < 4096:
+                    self._best_guess_cache[state_key] = (stored[0], stored[1])
+                return stored[0]
+
         possible_answers_array: np.ndarray = np.array(possible_answers)
+        # Encode the candidate set once; every per-guess entropy task reuses
+        # the same letter matrix instead of re-walking the Python strings
+        candidates_matrix: np.ndarray = self._encode_words(possible_answers)
 
         # Calculate entropy for all potential guesses within time budget
         best_word: str = possible_answers[0]  # Fallback
         best_entropy: float = 0.0
+        best_patterns: list[int] | None = None
 
-        start_time: float = time.time()
+        start_time: float = time.perf_counter()
+        # Tracks whether the time budget cut the scan short; truncated
+        # results must not be persisted as if they were optimal
+        scan_truncated = False
 
         # Use threading for parallelization (NumPy releases GIL)
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit entropy calculation tasks
-            futures: dict[Future[float], str] = {}
+            futures: dict[Future[tuple[float, list[int]]], str] = {}
             for guess_word in self._all_guesses.tolist():
                 guess_word: str = str(guess_word)
-                if time.time() - start_time > self.time_budget * TIME_BUDGET_BUFFER:
+                if time.perf_counter() - start_time > self.time_budget * TIME_BUDGET_BUFFER:
+                    scan_truncated = True
                     break
 
-                future: Future[float] = executor.submit(
-                    self._calculate_entropy_for_word, guess_word, possible_answers_array
+                future: Future[tuple[float, list[int]]] = executor.submit(
+                    self._entropy_with_patterns,
+                    guess_word,
+                    possible_answers_array,
+                    candidates_matrix,
                 )
                 futures[future] = guess_word
 
             # Collect results as they complete
             for future in as_completed(futures):  # type: ignore
                 try:
-                    entropy: float = future.result()  # type: ignore
-                    word: str = futures[future]  # type: ignore
+                    entropy, patterns = future.result()  # type: ignore
+                    word: str = futures.pop(future)  # type: ignore
 
                     if entropy > best_entropy:
                         best_entropy = entropy
                         best_word = word
+                        best_patterns = patterns
 
                 except Exception:
                     # Skip failed calculations
                     continue
 
                 # Check time budget
-                if time.time() - start_time > self.time_budget:
+                if time.perf_counter() - start_time > self.time_budget:
+                    scan_truncated = True
+                    break
+
+        # Cache the winner's pattern vector so filter strategies can reuse it
+        # instead of re-simulating feedback against the same candidate list
+        if best_patterns is not None:
+            self._fused_pattern_cache = (
+                best_word,
+                list(possible_answers),
+                best_patterns,
+            )
+
+        self.last_entropy = best_entropy
+        # The memo is shared across engines of the same mode but different
+        # budgets, so a truncated scan from a low-budget engine must not be
+        # served verbatim to a high-budget one
+        if not scan_truncated and len(self._best_guess_cache) < 4096:
+            self._best_guess_cache[state_key] = (best_word, best_entropy)
+
+        # Persist only results from a full scan: a budget-truncated pass (or
+        # one where every task failed, leaving the positional fallback) would
+        # otherwise be served as optimal to every future run
+        if turn2_code is not None and not scan_truncated and best_patterns is not None:
+            self._store_turn2_entry(
+                turn2_code, best_word, best_entropy, len(possible_answers)
+            )
+
+        return best_word
+
+    def _load_turn2_table(self) -> dict[int, tuple[str, float, int]]:
+        """Load this opener's turn-2 table, reading the pickle once per run.
+
+        Returns:
+            Mapping of opener feedback code to (guess, entropy, candidates)
+        """
+        with self._turn2_lock:
+            if self._turn2_table is None:
+                tables: dict[str, dict[int, tuple[str, float, int]]] = {}
+                try:
+                    with open(_TURN2_CACHE_PATH, "rb") as f:
+                        loaded = pickle.load(f)
+                    if isinstance(loaded, dict):
+                        tables = loaded
+                except (OSError, pickle.PickleError, EOFError):
+                    # Missing or corrupt cache: start fresh
+                    tables = {}
+                self._turn2_table = tables.get(self.OPTIMAL_FIRST_GUESS, {})
+            return self._turn2_table
+
+    def _store_turn2_entry(
+        self, code: int, guess: str, entropy: float, num_candidates: int
+    ) -> None:
+        """Record a turn-2 result and persist the table to disk.
+
+        Args:
+            code: Opener feedback code for this game state
+            guess: Best second guess found by the entropy scan
+            entropy: Entropy of that guess
+            num_candidates: Candidate count the scan ran against
+        """
+        table = self._load_turn2_table()
+        with self._turn2_lock:
+            table[code] = (guess, entropy, num_candidates)
+            try:
+                _TURN2_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                tables: dict[str, dict[int, tuple[str, float, int]]] = {}
+                try:
+                    with open(_TURN2_CACHE_PATH, "rb") as f:
+                        loaded = pickle.load(f)
+                    if isinstance(loaded, dict):
+                        tables = loaded
+                except (OSError, pickle.PickleError, EOFError):
+                    pass
+                tables[self.OPTIMAL_FIRST_GUESS] = table
+                with open(_TURN2_CACHE_PATH, "wb") as f:
+                    pickle.dump(tables, f)
+            except OSError as e:
+                # Cache persistence is best-effort; the in-memory table still
+                # serves the rest of this run
+                self.logger.debug("Could not persist turn-2 cache: %s", e)
+
+    def get_cached_patterns(self, guess: str, candidates: list[str]) -> list[int] | None:
+        """Return the pattern codes computed for `guess` during find_best_guess.
+
+        The codes are only returned when they were computed against the same
+        candidate list (same words, same order); otherwise None is returned and
+        the caller must simulate feedback itself.
+
+        Args:
+            guess: The guess word the patterns were computed for
+            candidates: The candidate list the patterns must correspond to
+
+        Returns:
+            List of base-3 feedback codes aligned with candidates, or None
+        """
+        cache = self._fused_pattern_cache
+        if cache is not None and cache[0] == guess and cache[1] == candidates:
+            return cache[2]
+        return None
+
+    def get_opener_signature(
+        self, guess: str, candidates: list[str]
+    ) -> np.ndarray | None:
+        """Cached feedback codes for `guess` against the full answer list.
+
+        Turn-1 filtering always faces the complete answer set, and every game
+        opens with the same handful of high-entropy words, so their per-answer
+        feedback codes are computed once and reused across games. Returns None
+        unless candidates is exactly the lexicon answer list in load order,
+        which keeps the cached signature aligned with the candidates.
+
+        Args:
+            guess: The opening guess word
+            candidates: The candidate list the signature must correspond to
+
+        Returns:
+            uint8 array of base-3 feedback codes aligned with candidates,
+            or None when the candidates are not the full answer list
+        """
+        if len(candidates) != len(self._full_answers):
+            return None
+        if candidates != self._full_answers:
+            return None
+
+        signature = self._opener_signatures.get(guess)
+        if signature is None:
+            # Bounded: only genuinely hot openers should accumulate here
+            if len(self._opener_signatures) >= 32:
+                return None
+            signature = self.feedback_codes_matrix(
+                [guess], self._full_answers, self.lexicon.answers_matrix
+            )[0].astype(np.uint8)
+            self._opener_signatures[guess] = signature
+        return signature
+
+    def find_best_guess_minimax(self, possible_answers: list[str]) -> str:
+        """Find the guess minimizing the worst-case remaining candidate count.
+
+        Knuth-style minimax: for each potential guess, partition the possible
+        answers by the feedback they would produce and score the guess by its
+        largest bucket. The guess with the smallest worst-case bucket is
+        returned; ties prefer words that are themselves possible answers.
+
+        Args:
+            possible_answers: Current list of possible answer words
+
+        Returns:
+            The guess with the best worst-case guarantee
+        """
+        possible_answers_array: np.ndarray = np.array(possible_answers)
+        answer_set: set[str] = set(possible_answers)
+
+        best_word: str = possible_answers[0]  # Fallback
+        best_worst_case: int = len(possible_answers) + 1
+        best_is_answer: bool = False
+
+        start_time: float = time.perf_counter()
+        self._last_minimax_truncated = False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures: dict[Future[int], str] = {}
+            for guess_word in self._all_guesses.tolist():
+                guess_word: str = str(guess_word)
+                if time.perf_counter() - start_time > self.time_budget * TIME_BUDGET_BUFFER:
+                    self._last_minimax_truncated = True
+                    break
+
+                future: Future[int] = executor.submit(
+                    self._max_partition_size, guess_word, possible_answers_array
+                )
+                futures[future] = guess_word
+
+            for future in as_completed(futures):  # type: ignore
+                try:
+                    worst_case: int = future.result()  # type: ignore
+                    word: str = futures.pop(future)  # type: ignore
+                except Exception:
+                    continue
+
+                is_answer = word in answer_set
+                if worst_case < best_worst_case or (
+                    worst_case == best_worst_case and is_answer and not best_is_answer
+                ):
+                    best_worst_case = worst_case
+                    best_word = word
+                    best_is_answer = is_answer
+
+                if time.perf_counter() - start_time > self.time_budget:
+                    self._last_minimax_truncated = True
                     break
 
         return best_word
 
+    def _max_partition_size(
+        self, guess_word: str, possible_answers: np.ndarray
+    ) -> int:
+        """Return the size of the largest feedback bucket for a guess word.
+
+        Args:
+            guess_word: The word to evaluate
+            possible_answers: Array of possible answer words
+
+        Returns:
+            Worst-case number of candidates remaining after this guess
+        """
+        pattern_counts: defaultdict[int, int] = defaultdict(int)
+
+        # Bind the hot callable once; the loop body then runs on locals only
+        simulate_code = self._simulate_feedback_code
+        for answer in possible_answers:
+            pattern_counts[simulate_code(guess_word, str(answer))] += 1
+
+        return max(pattern_counts.values())
+
     def _calculate_entropy_for_word(
         self, guess_word: str, possible_answers: np.ndarray
     ) -> float:
@@ -131,24 +453,44 @@ class SolverEngine:
         Returns:
             Entropy value in bits
         """
-        pattern_counts: defaultdict[str, int] = defaultdict(int)
+        return self._entropy_with_patterns(guess_word, possible_answers)[0]
 
-        # Simulate feedback for each possible answer
-        for answer in possible_answers:
-            answer: str = str(answer)
-            pattern: str = self._simulate_feedback(guess=guess_word, answer=answer)
-            pattern_counts[pattern] += 1
+    def _entropy_with_patterns(
+        self,
+        guess_word: str,
+        possible_answers: np.ndarray,
+        answers_matrix: np.ndarray | None = None,
+    ) -> tuple[float, list[int]]:
+        """Calculate entropy and the per-answer pattern codes for a guess word.
+
+        The code vector is a by-product of building the entropy histogram;
+        returning it lets callers reuse it for filtering without a second
+        full simulation pass.
+
+        Args:
+            guess_word: The word to calculate entropy for
+            possible_answers: Array of possible answer words
+            answers_matrix: Optional pre-encoded uint8 letter matrix for
+                possible_answers; callers scanning many guesses against the
+                same candidate set should encode it once and pass it here
 
-        # Calculate Shannon entropy
-        total_answers: int = len(possible_answers)
-        entropy: float = 0.0
+        Returns:
+            Tuple of (entropy in bits, base-3 codes aligned with possible_answers)
+        """
+        if answers_matrix is None:
+            answers_matrix = self._encode_words([str(w) for w in possible_answers])
+
+        codes = self.feedback_codes_matrix(
+            [guess_word], possible_answers, answers_matrix=answers_matrix
+        )[0]
 
-        for count in pattern_counts.values():
-            if count > 0:
-                probability: float = count / total_answers
-                entropy -= probability * math.log2(probability)
+        # Shannon entropy from a dense 243-bucket histogram
+        counts = np.bincount(codes, minlength=243)
+        nonzero = counts[counts > 0]
+        probabilities = nonzero / len(possible_answers)
+        entropy = float(-(probabilities * np.log2(probabilities)).sum())
 
-        return entropy
+        return entropy, codes.tolist()
 
     def _simulate_feedback(self, guess: str, answer: str) -> str:
         """Simulate Wordle feedback for a guess against an answer.
@@ -162,35 +504,53 @@ class SolverEngine:
         Returns:
             Feedback pattern string (e.g., "++o--")
         """
-        guess = guess.upper()
-        answer = answer.upper()
+        return _CODE_TO_PATTERN[self._simulate_feedback_code(guess, answer)]
+
+    def _simulate_feedback_code(self, guess: str, answer: str) -> int:
+        """Simulate Wordle feedback as a packed base-3 integer in [0, 243).
 
+        Digit k (least-significant first) encodes position k: 2=correct,
+        1=present, 0=absent. Integer codes avoid string allocation in the
+        hot loops; the string form is a table lookup away.
+
+        Args:
+            guess: The guessed word
+            answer: The actual answer word
+
+        Returns:
+            Base-3 packed feedback code
+        """
         if len(guess) != WORD_LENGTH or len(answer) != WORD_LENGTH:
             raise ValueError("Words must be exactly 5 letters")
 
-        # Initialize feedback array
-        feedback: list[str] = ["-"] * WORD_LENGTH
+        # Work on ASCII byte codes so the two passes below are pure integer
+        # arithmetic (no per-character string compares or dict hashing)
+        guess_bytes = guess.upper().encode("ascii")
+        answer_bytes = answer.upper().encode("ascii")
 
-        # Count letter frequencies in the answer
-        answer_letter_counts: defaultdict[str, int] = defaultdict(int)
-        for letter in answer:
-            answer_letter_counts[letter] += 1
+        # Count letter frequencies in the answer (flat 26-slot table)
+        answer_letter_counts = [0] * 26
+        for letter in answer_bytes:
+            answer_letter_counts[letter - 65] += 1
 
         # First pass: Mark exact matches (green)
+        code = 0
+        correct = [False] * WORD_LENGTH
         for i in range(WORD_LENGTH):
-            if guess[i] == answer[i]:
-                feedback[i] = "+"
-                answer_letter_counts[guess[i]] -= 1
+            if guess_bytes[i] == answer_bytes[i]:
+                correct[i] = True
+                code += 2 * _POW3[i]
+                answer_letter_counts[guess_bytes[i] - 65] -= 1
 
         # Second pass: Mark present but wrong position (yellow)
         for i in range(WORD_LENGTH):
-            if feedback[i] != "+":  # Not already marked as correct
-                letter: str = guess[i]
+            if not correct[i]:
+                letter = guess_bytes[i] - 65
                 if answer_letter_counts[letter] > 0:
-                    feedback[i] = "o"
+                    code += _POW3[i]
                     answer_letter_counts[letter] -= 1
 
-        return "".join(feedback)
+        return code
 
     def simulate_feedback(self, guess: str, answer: str) -> str:
         """Public wrapper to simulate Wordle feedback pattern.
@@ -204,6 +564,129 @@ class SolverEngine:
         """
         return self._simulate_feedback(guess=guess, answer=answer)
 
+    @staticmethod
+    def _encode_words(words: list[str]) -> np.ndarray:
+        """Encode 5-letter words as a uint8 matrix of letter codes."""
+        joined = "".join(words).upper()
+        if len(joined) != WORD_LENGTH * len(words):
+            raise ValueError("Words must be exactly 5 letters")
+        flat = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+        return flat.reshape(len(words), WORD_LENGTH)
+
+    def feedback_codes_matrix(
+        self,
+        guesses: list[str],
+        possible_answers: list[str],
+        answers_matrix: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Compute base-3 feedback codes for every guess/answer pair at once.
+
+        Implements the two-pass Wordle rules (greens first, then yellows
+        limited by remaining letter counts) with NumPy broadcasting, replacing
+        G*A Python-level simulate_feedback calls with a few array passes.
+
+        Args:
+            guesses: Guess words (G entries)
+            possible_answers: Answer words (A entries)
+            answers_matrix: Optional pre-encoded uint8 ASCII letter matrix for
+                possible_answers (e.g. WordLexicon.answers_matrix), skipping
+                the per-call encoding pass
+
+        Returns:
+            uint16 array of shape (G, A); entry [g, a] encodes the feedback
+            pattern as sum(digit_k * 3**k) with 2=correct, 1=present, 0=absent
+        """
+        guess_letters = self._encode_words(guesses) - ord("A")  # (G, 5)
+        if answers_matrix is None:
+            answers_matrix = self._encode_words(possible_answers)
+        answer_letters = answers_matrix - ord("A")  # (A, 5)
+        num_guesses = len(guesses)
+        num_answers = len(possible_answers)
+
+        # Greens: exact positional matches
+        greens = guess_letters[:, None, :] == answer_letters[None, :, :]  # (G, A, 5)
+
+        # Letter inventory per answer, then consume the green matches
+        answer_counts = np.zeros((num_answers, 26), dtype=np.int16)
+        np.add.at(
+            answer_counts,
+            (np.arange(num_answers)[:, None], answer_letters),
+            1,
+        )
+        available = np.broadcast_to(
+            answer_counts[None, :, :], (num_guesses, num_answers, 26)
+        ).copy()
+
+        guess_rows = np.arange(num_guesses)[:, None]
+        answer_cols = np.arange(num_answers)[None, :]
+        for pos in range(WORD_LENGTH):
+            letter_col = guess_letters[:, pos][:, None]  # (G, 1)
+            available[guess_rows, answer_cols, letter_col] -= greens[:, :, pos]
+
+        # Yellows: letter still available elsewhere, consumed left to right
+        codes = np.zeros((num_guesses, num_answers), dtype=np.uint16)
+        for pos in range(WORD_LENGTH):
+            letter_col = guess_letters[:, pos][:, None]
+            green = greens[:, :, pos]
+            yellow = ~green & (available[guess_rows, answer_cols, letter_col] > 0)
+            available[guess_rows, answer_cols, letter_col] -= yellow
+            codes += (2 * green + yellow).astype(np.uint16) * np.uint16(3**pos)
+
+        return codes
+
+    def calculate_detailed_entropy_batch(
+        self,
+        guess_words: list[str],
+        possible_answers: list[str],
+        answers_matrix: np.ndarray | None = None,
+    ) -> list[EntropyCalculation]:
+        """Calculate entropy for many guess words against the same answers.
+
+        Computes the full feedback-code matrix once and derives each word's
+        entropy from a 243-bucket histogram, avoiding a Python simulation
+        loop per word.
+
+        Args:
+            guess_words: Words to analyze
+            possible_answers: Current possible answers
+            answers_matrix: Optional pre-encoded letter matrix for
+                possible_answers, forwarded to feedback_codes_matrix
+
+        Returns:
+            Entropy calculation results aligned with guess_words
+        """
+        start_time: float = time.perf_counter()
+
+        codes = self.feedback_codes_matrix(
+            guess_words, possible_answers, answers_matrix=answers_matrix
+        )
+        total_answers = len(possible_answers)
+
+        # Histogram every guess at once: offset each row's codes into its own
+        # 243-slot band so a single bincount covers the whole batch
+        num_guesses = len(guess_words)
+        offsets = np.arange(num_guesses, dtype=np.int64)[:, None] * 243
+        counts = np.bincount(
+            (codes.astype(np.int64) + offsets).ravel(), minlength=num_guesses * 243
+        ).reshape(num_guesses, 243)
+
+        probabilities = counts / total_answers
+        plogp = np.zeros_like(probabilities)
+        np.log2(probabilities, out=plogp, where=counts > 0)
+        entropies = -(probabilities * plogp).sum(axis=1)
+        pattern_counts = np.count_nonzero(counts, axis=1)
+
+        calculation_time = time.perf_counter() - start_time
+        return [
+            EntropyCalculation(
+                word=word,
+                entropy=float(entropies[idx]),
+                pattern_count=int(pattern_counts[idx]),
+                calculation_time=calculation_time,
+            )
+            for idx, word in enumerate(guess_words)
+        ]
+
     def calculate_detailed_entropy(
         self, guess_word: str, possible_answers: list[str]
     ) -> EntropyCalculation:
@@ -216,7 +699,7 @@ class SolverEngine:
         Returns:
             Detailed entropy calculation result
         """
-        start_time: float = time.time()
+        start_time: float = time.perf_counter()
 
         possible_answers_array: np.ndarray = np.array(possible_answers)
         entropy: float = self._calculate_entropy_for_word(
@@ -224,13 +707,12 @@ class SolverEngine:
         )
 
         # Count unique patterns
-        patterns: set[str] = set()
+        patterns: set[int] = set()
         for answer in possible_answers:
             answer: str = str(answer)
-            pattern: str = self._simulate_feedback(guess=guess_word, answer=answer)
-            patterns.add(pattern)
+            patterns.add(self._simulate_feedback_code(guess_word, answer))
 
-        calculation_time: float = time.time() - start_time
+        calculation_time: float = time.perf_counter() - start_time
 
         return EntropyCalculation(
             word=guess_word,
@@ -4,6 +4,7 @@ from config.settings import Settings
 from config.settings import settings as default_settings
 from core.domain.constants import WORD_LENGTH
 from core.domain.models import FeedbackType, GameState, GuessResult
+from core.domain.types import GuessHistoryItem
 from infrastructure.data.word_lexicon import WordLexicon
 from utils.logging_config import get_logger
 
@@ -31,14 +32,37 @@ class ApiGameStateManager(BaseGameStateManager):
         self.solver = self._create_solver()
         self.filter_strategy: DuplicateFilterStrategy = DuplicateFilterStrategy()
 
-        # Initialize with all possible answers
-        self._possible_answers: list[str] = (
+        # Snapshot the starting answers once; the list is only ever replaced
+        # (never mutated in place) so resets can reuse it without re-copying
+        # the full lexicon per game
+        self._initial_answers: list[str] = (
             initial_answers or self.lexicon.get_all_answers()
         )
+        self._possible_answers: list[str] = self._initial_answers
+        # Candidate lists are only ever replaced, never mutated in place, so
+        # the state can share the manager's list (as BaseGameStateManager does)
         self.game_state: GameState = GameState(
-            possible_answers=self._possible_answers.copy()
+            possible_answers=self._possible_answers
         )
         self._guess_history: list[GuessResult] = []
+        # Guess-history items are built once as guesses arrive so summaries
+        # don't re-serialize the whole history per call
+        self._history_items: list[GuessHistoryItem] = []
+
+        # Lazily built immutable snapshot of the current answers; the solver
+        # keys its memo on tuple(candidates), which is free when the input
+        # is already a tuple. Invalidated whenever the list is replaced.
+        self._answers_tuple: tuple[str, ...] | None = None
+
+        # Single-slot cache of compiled filter rules for the last guess
+        # result seen, so per-candidate checks skip the feedback walk
+        self._rules_for: GuessResult | None = None
+        self._rules: tuple[
+            list[tuple[int, str]],
+            list[tuple[int, str]],
+            list[tuple[int, str]],
+            list[str],
+        ] | None = None
 
     def _create_solver(self):
         """Create solver engine for API mode."""
@@ -53,14 +77,32 @@ class ApiGameStateManager(BaseGameStateManager):
             guess_result: The result of a guess
         """
         self._guess_history.append(guess_result)
+        self._history_items.append(
+            {
+                "guess": guess_result.guess,
+                "feedback": guess_result.to_pattern_string(),
+                "correct": guess_result.is_correct,
+            }
+        )
         self.game_state.add_guess(guess_result)
 
-        # Use strategy filtering for API mode
+        # If the game just ended, don't spend a pass narrowing candidates
+        if self.game_state.is_game_over:
+            if guess_result.is_correct:
+                self._possible_answers = [guess_result.guess]
+                self.game_state.possible_answers = [guess_result.guess]
+                self._answers_tuple = None
+            return
+
+        # Use strategy filtering for API mode. The strategy returns a fresh
+        # survivor list each call and neither side mutates it in place, so
+        # the game state can share it without a defensive copy
         self._possible_answers = self.filter_strategy.filter_answers(
             guess_result=guess_result,
             candidates=self._possible_answers,
         )
-        self.game_state.possible_answers = self._possible_answers.copy()
+        self.game_state.possible_answers = self._possible_answers
+        self._answers_tuple = None
 
     def _is_answer_consistent_improved(
         self, guess_result: GuessResult, answer: str
@@ -75,45 +117,87 @@ class ApiGameStateManager(BaseGameStateManager):
               do NOT ban it globally; only enforce candidate[i] != letter.
             - Otherwise, the letter should not appear anywhere in candidate.
         """
-        guess = guess_result.guess.upper()
-        cand = answer.upper()
-        fb = guess_result.feedback
-
-        if len(guess) != WORD_LENGTH or len(cand) != WORD_LENGTH:
+        cand = answer
+        if len(cand) != WORD_LENGTH:
             return False
 
-        # Pre-compute letter roles in feedback
-        letter_has_non_absent: dict[str, bool] = {}
-        for g_ch, f_type in zip(guess, fb, strict=False):
-            if f_type != FeedbackType.ABSENT:
-                letter_has_non_absent[g_ch] = True
-            else:
-                letter_has_non_absent.setdefault(g_ch, False)
-
-        # Pass 1: enforce CORRECT positions
-        for i, (g_ch, f_type) in enumerate(zip(guess, fb, strict=False)):
-            if f_type == FeedbackType.CORRECT and cand[i] != g_ch:
+        # Guess-side work (feedback walks, letter-role mask) is constant
+        # across candidates, so it is compiled once per guess result and
+        # reused; each candidate check then touches only resolved rule lists
+        if guess_result is self._rules_for and self._rules is not None:
+            rules = self._rules
+        else:
+            rules = self._compile_filter_rules(guess_result)
+            if rules is None:
                 return False
+            self._rules_for = guess_result
+            self._rules = rules
+        correct_rules, present_rules, banned_positions, banned_letters = rules
 
-        # Pass 2: enforce PRESENT and ABSENT with permissive rules
-        for i, (g_ch, f_type) in enumerate(zip(guess, fb, strict=False)):
-            if f_type == FeedbackType.PRESENT:
-                if cand[i] == g_ch:
-                    return False
-                if g_ch not in cand:
-                    return False
-            elif f_type == FeedbackType.ABSENT:
-                if letter_has_non_absent.get(g_ch, False):
-                    # Only ban this position
-                    if cand[i] == g_ch:
-                        return False
-                else:
-                    # Ban globally
-                    if g_ch in cand:
-                        return False
+        for i, g_ch in correct_rules:
+            if cand[i] != g_ch:
+                return False
+        for i, g_ch in present_rules:
+            if cand[i] == g_ch or g_ch not in cand:
+                return False
+        for i, g_ch in banned_positions:
+            if cand[i] == g_ch:
+                return False
+        for g_ch in banned_letters:
+            if g_ch in cand:
+                return False
 
         return True
 
+    @staticmethod
+    def _compile_filter_rules(
+        guess_result: GuessResult,
+    ) -> tuple[
+        list[tuple[int, str]],
+        list[tuple[int, str]],
+        list[tuple[int, str]],
+        list[str],
+    ] | None:
+        """Resolve feedback into concrete per-candidate checks.
+
+        Returns (correct, present, banned-position, banned-letter) rule
+        lists, or None when the guess is malformed.
+        """
+        guess = guess_result.guess
+        fb = guess_result.feedback
+        if len(guess) != WORD_LENGTH:
+            return None
+
+        # Direct indexing over the (tiny, equal-length) sequences avoids the
+        # zip iterator allocations; n caps at the shorter side to keep the
+        # old truncating zip semantics for malformed feedback
+        n = min(WORD_LENGTH, len(fb))
+
+        # 26-bit mask of letters with at least one non-ABSENT mark decides
+        # whether an ABSENT slot bans a position or the whole letter
+        nonabs_mask = 0
+        for i in range(n):
+            if fb[i] != FeedbackType.ABSENT:
+                nonabs_mask |= 1 << (ord(guess[i]) - 65)
+
+        correct_rules: list[tuple[int, str]] = []
+        present_rules: list[tuple[int, str]] = []
+        banned_positions: list[tuple[int, str]] = []
+        banned_letters: list[str] = []
+        for i in range(n):
+            g_ch = guess[i]
+            f_type = fb[i]
+            if f_type == FeedbackType.CORRECT:
+                correct_rules.append((i, g_ch))
+            elif f_type == FeedbackType.PRESENT:
+                present_rules.append((i, g_ch))
+            elif nonabs_mask & (1 << (ord(g_ch) - 65)):
+                banned_positions.append((i, g_ch))
+            else:
+                banned_letters.append(g_ch)
+
+        return correct_rules, present_rules, banned_positions, banned_letters
+
     def get_possible_answers(self) -> list[str]:
         """Get the current list of possible answers.
 
@@ -122,6 +206,32 @@ class ApiGameStateManager(BaseGameStateManager):
         """
         return self._possible_answers.copy()
 
+    def get_possible_answers_view(self) -> list[str]:
+        """Get the current possible answers without copying.
+
+        The returned list is shared with the manager; filtering replaces it
+        rather than mutating in place, so callers must treat it as
+        read-only.
+
+        Returns:
+            The internal list of possible answers (read-only)
+        """
+        return self._possible_answers
+
+    def get_possible_answers_tuple(self) -> tuple[str, ...]:
+        """Get the current possible answers as an immutable snapshot.
+
+        Built at most once per filtering step. Per-turn loops pass this to
+        the solver so its memo key (a tuple of the candidates) costs
+        nothing to construct.
+
+        Returns:
+            Tuple of possible answer words
+        """
+        if self._answers_tuple is None:
+            self._answers_tuple = tuple(self._possible_answers)
+        return self._answers_tuple
+
     def get_current_state(self) -> GameState:
         """Get the current game state.
 
@@ -130,6 +240,14 @@ class ApiGameStateManager(BaseGameStateManager):
         """
         return self.game_state
 
+    def get_guess_history(self) -> list[GuessHistoryItem]:
+        """Get the formatted guess history built up during the game.
+
+        Returns:
+            Guess-history items in play order (shallow copy)
+        """
+        return list(self._history_items)
+
     def is_solved(self) -> bool:
         """Check if the game is solved.
 
@@ -154,6 +272,20 @@ class ApiGameStateManager(BaseGameStateManager):
         """
         return self.game_state.is_solved or self.game_state.is_failed
 
+    def reset_game(self) -> None:
+        """Reset the game state for a new game.
+
+        Restores the initial answer snapshot without re-copying the lexicon,
+        so a pooled manager can be reused across games.
+        """
+        self._possible_answers = self._initial_answers
+        self.game_state = GameState(possible_answers=self._possible_answers)
+        self._guess_history = []
+        self._history_items = []
+        self._answers_tuple = None
+        self._rules_for = None
+        self._rules = None
+
     def get_game_summary(self) -> GameSummaryDict:
         """Get a summary of the current game state.
 
@@ -167,13 +299,6 @@ class ApiGameStateManager(BaseGameStateManager):
             "is_solved": self.game_state.is_solved,
             "is_failed": self.game_state.is_failed,
             "remaining_turns": self.game_state.remaining_turns,
-            "guesses": [
-                {
-                    "guess": gr.guess,
-                    "feedback": gr.to_pattern_string(),
-                    "correct": gr.is_correct,
-                }
-                for gr in self._guess_history
-            ],
+            "guesses": list(self._history_items),
             "possible_answers": self._possible_answers.copy(),
         }
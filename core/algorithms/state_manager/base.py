@@ -22,6 +22,7 @@ class BaseGameStateManager(ABC):
         self,
         initial_answers: list[str] | None = None,
         app_settings: Settings | None = None,
+        solver: SolverEngine | None = None,
     ):
         """Initialize base game state manager.
 
@@ -29,21 +30,36 @@ class BaseGameStateManager(ABC):
             initial_answers: Optional list of initial possible answers.
             If None, uses all possible answers from lexicon.
             app_settings: Application settings
+            solver: Optional solver to share. Callers that run entropy
+            scans should pass their own engine so the filter strategy can
+            reuse the pattern codes those scans cache.
         """
         self.settings: Settings = app_settings or default_settings
         self.lexicon: WordLexicon = WordLexicon()
-        self.solver: SolverEngine = SolverEngine(app_settings=self.settings)
+        self.solver: SolverEngine = solver or SolverEngine(app_settings=self.settings)
         self.filter_strategy: Any = None  # Will be set by subclasses
 
-        initial_possible_answers = initial_answers or self.lexicon.answers
+        # Snapshot the starting answers once; the list is only ever replaced
+        # (never mutated in place) so resets can reuse it without re-copying
+        # the full lexicon per game
+        self._initial_answers: list[str] = initial_answers or self.lexicon.answers
 
         self.game_state: GameState = GameState(
             turn=1,
-            possible_answers=initial_possible_answers.copy(),
+            possible_answers=self._initial_answers,
             is_solved=False,
             is_failed=False,
         )
 
+        # Guess-history items are built once as guesses arrive so summaries
+        # don't re-serialize the whole history per call
+        self._history_items: list[GuessHistoryItem] = []
+
+        # Lazily built immutable snapshot of the current answers; the solver
+        # keys its memo on tuple(candidates), which is free when the input
+        # is already a tuple. Invalidated whenever the list is replaced.
+        self._answers_tuple: tuple[str, ...] | None = None
+
     @abstractmethod
     def add_guess_result(self, guess_result: GuessResult) -> None:
         """Add a guess result and update possible answers.
@@ -63,6 +79,7 @@ class BaseGameStateManager(ABC):
             guess_result=guess_result,
             candidates=self.game_state.possible_answers,
         )
+        self._answers_tuple = None
 
     def _is_answer_consistent(
         self, guess: str, feedback: list[FeedbackType], answer: str
@@ -106,6 +123,33 @@ class BaseGameStateManager(ABC):
         """
         return self.game_state.possible_answers.copy()
 
+    def get_possible_answers_view(self) -> list[str]:
+        """Get the current possible answers without copying.
+
+        The returned list is shared with the game state; filtering replaces
+        it rather than mutating in place, so callers must treat it as
+        read-only. Use this in per-turn loops where get_possible_answers'
+        defensive copy is pure overhead.
+
+        Returns:
+            The internal list of possible answer words (read-only)
+        """
+        return self.game_state.possible_answers
+
+    def get_possible_answers_tuple(self) -> tuple[str, ...]:
+        """Get the current possible answers as an immutable snapshot.
+
+        Built at most once per filtering step. Per-turn loops pass this to
+        the solver so its memo key (a tuple of the candidates) costs
+        nothing to construct.
+
+        Returns:
+            Tuple of possible answer words
+        """
+        if self._answers_tuple is None:
+            self._answers_tuple = tuple(self.game_state.possible_answers)
+        return self._answers_tuple
+
     def get_remaining_answers_count(self) -> int:
         """Get the count of remaining possible answers.
 
@@ -144,15 +188,9 @@ class BaseGameStateManager(ABC):
         Returns:
             Dictionary containing game summary information
         """
-        # Convert guesses to proper GuessHistoryItem format
-        guess_history: list[GuessHistoryItem] = [
-            {
-                "guess": guess.guess,
-                "feedback": guess.to_pattern_string(),
-                "correct": guess.is_correct,
-            }
-            for guess in self.game_state.guesses
-        ]
+        # History items were built incrementally by _record_guess; a shallow
+        # copy keeps callers free to hold the list across a reset
+        guess_history: list[GuessHistoryItem] = list(self._history_items)
 
         return {
             "turn": self.game_state.turn,
@@ -165,14 +203,35 @@ class BaseGameStateManager(ABC):
             "possible_answers": self.game_state.possible_answers.copy(),
         }
 
+    def get_guess_history(self) -> list[GuessHistoryItem]:
+        """Get the formatted guess history built up during the game.
+
+        Returns:
+            Guess-history items in play order (shallow copy)
+        """
+        return list(self._history_items)
+
     def reset_game(self) -> None:
         """Reset the game state for a new game."""
         self.game_state = GameState(
             turn=1,
-            possible_answers=self.lexicon.answers.copy(),
+            possible_answers=self._initial_answers,
             is_solved=False,
             is_failed=False,
         )
+        self._history_items = []
+        self._answers_tuple = None
+
+    def _record_guess(self, guess_result: GuessResult) -> None:
+        """Add a guess to the game state and the running history items."""
+        self.game_state.add_guess(guess_result)
+        self._history_items.append(
+            {
+                "guess": guess_result.guess,
+                "feedback": guess_result.to_pattern_string(),
+                "correct": guess_result.is_correct,
+            }
+        )
 
 
 class GameStateManager(BaseGameStateManager):
@@ -182,6 +241,7 @@ class GameStateManager(BaseGameStateManager):
         self,
         initial_answers: list[str] | None = None,
         app_settings: Settings | None = None,
+        solver: SolverEngine | None = None,
     ):
         """Initialize standard game state manager.
 
@@ -189,8 +249,9 @@ class GameStateManager(BaseGameStateManager):
             initial_answers: Optional list of initial possible answers.
             If None, uses all possible answers from lexicon.
             app_settings: Application settings
+            solver: Optional solver to share with the filter strategy
         """
-        super().__init__(initial_answers, app_settings)
+        super().__init__(initial_answers, app_settings, solver)
         from .strategies import StandardFilterStrategy
 
         self.filter_strategy = StandardFilterStrategy(self.solver)
@@ -201,8 +262,8 @@ class GameStateManager(BaseGameStateManager):
         Args:
             guess_result: The result of the guess including feedback
         """
-        # Add guess to game state
-        self.game_state.add_guess(guess_result)
+        # Add guess to game state and the running history
+        self._record_guess(guess_result)
 
         # If game is over, don't filter further
         if self.game_state.is_game_over:
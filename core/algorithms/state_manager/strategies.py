@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import Protocol
 
+import numpy as np
+
 from core.algorithms.solver_engine import SolverEngine
 from core.domain.constants import WORD_LENGTH
 from core.domain.models import FeedbackType, GuessResult
@@ -36,13 +38,41 @@ class StandardFilterStrategy:
     def filter_answers(
         self, guess_result: GuessResult, candidates: list[str]
     ) -> list[str]:
-        expected = guess_result.to_pattern_string()
+        # A fully correct guess identifies the answer outright; skip the scan
+        if guess_result.is_correct:
+            return [guess_result.guess]
+
+        # Compare packed base-3 codes rather than 5-char strings; integer
+        # equality is a single machine compare in both paths below
+        expected = guess_result.pattern_code_base3
         guess = guess_result.guess
-        filtered: list[str] = []
-        for answer in candidates:
-            if self._solver.simulate_feedback(guess=guess, answer=answer) == expected:
-                filtered.append(answer)
-        return filtered
+
+        # Reuse codes already computed by the solver's entropy scan for this
+        # exact guess/candidate pairing, avoiding a second full simulation pass
+        cached_patterns = self._solver.get_cached_patterns(guess, candidates)
+        if cached_patterns is not None:
+            mask = np.asarray(cached_patterns) == expected
+            return np.asarray(candidates, dtype=object)[mask].tolist()
+
+        # Turn-1 filtering: openers repeat across games, so their feedback
+        # signatures against the full answer list are precomputed once
+        signature = self._solver.get_opener_signature(guess, candidates)
+        if signature is not None:
+            mask = signature == expected
+            return np.asarray(candidates, dtype=object)[mask].tolist()
+
+        # Large candidate sets go through the vectorized code kernel — one
+        # array pass instead of a per-candidate simulation loop. Tiny sets
+        # stay scalar since the matrix setup would dominate.
+        if len(candidates) >= 32:
+            codes = self._solver.feedback_codes_matrix([guess], candidates)[0]
+            mask = codes == expected
+            return np.asarray(candidates, dtype=object)[mask].tolist()
+
+        simulate_code = self._solver._simulate_feedback_code
+        return [
+            answer for answer in candidates if simulate_code(guess, answer) == expected
+        ]
 
 
 class DuplicateFilterStrategy:
@@ -58,51 +88,173 @@ class DuplicateFilterStrategy:
         * Otherwise, ban globally (letter not in candidate)
     """
 
+    def __init__(self) -> None:
+        # Encoded view of the list returned by the previous filter pass;
+        # pruned alongside the survivors so later turns skip re-encoding
+        self._last_candidates: list[str] | None = None
+        self._last_encoded: tuple[np.ndarray, np.ndarray] | None = None
+
     def filter_answers(
         self, guess_result: GuessResult, candidates: list[str]
     ) -> list[str]:
+        # A fully correct guess identifies the answer outright; skip the scan
+        if guess_result.is_correct:
+            return [guess_result.guess.upper()]
+
         guess = guess_result.guess.upper()
         fb = guess_result.feedback
-        out: list[str] = []
 
-        # Pre-compute letter roles for this feedback
-        letter_has_non_absent: dict[str, bool] = {}
-        for g_ch, f_type in zip(guess, fb, strict=False):
+        # Single walk over the feedback: materialize the per-position rules and
+        # a 26-bit mask of letters with a non-absent occurrence, so the role
+        # check below is one shift-and-test instead of a dict lookup
+        rules: list[tuple[int, str, FeedbackType]] = []
+        nonabs_mask = 0
+        n_correct = 0
+        for i, (g_ch, f_type) in enumerate(zip(guess, fb, strict=False)):
+            rules.append((i, g_ch, f_type))
             if f_type != FeedbackType.ABSENT:
-                letter_has_non_absent[g_ch] = True
+                nonabs_mask |= 1 << (ord(g_ch) - 65)
+            if f_type == FeedbackType.CORRECT:
+                n_correct += 1
+
+        # All-CORRECT feedback pins the answer to the guess itself; no scan
+        if n_correct == len(rules) and rules:
+            return [guess] if guess in candidates else []
+
+        # Vectorized path: apply all per-position rules on an encoded letter
+        # matrix in a handful of NumPy calls instead of a Python loop per
+        # candidate. This dominates on early turns with thousands of candidates.
+        # Reuse the encoding pruned on the previous turn when the caller
+        # passes back the exact survivor list we returned
+        if candidates is self._last_candidates and self._last_encoded is not None:
+            encoded = self._last_encoded
+        else:
+            encoded = self._encode_candidates(candidates)
+        if encoded is not None:
+            letters, present_mask = encoded
+
+            # All-ABSENT feedback (common on turn 1) reduces every rule to a
+            # global letter ban, answered by one bitmask test per candidate
+            if nonabs_mask == 0:
+                guess_bits = np.uint32(0)
+                for _i, g_ch, _f in rules:
+                    guess_bits |= np.uint32(1 << (ord(g_ch) - 65))
+                ok = (present_mask & guess_bits) == 0
+                survivors = np.asarray(candidates, dtype=object)[ok].tolist()
+                self._last_candidates = survivors
+                self._last_encoded = (letters[ok], present_mask[ok])
+                return survivors
+
+            ok = np.ones(len(candidates), dtype=bool)
+            for i, g_ch, f_type in rules:
+                code = ord(g_ch)
+                bit = np.uint32(1 << (code - ord("A")))
+                if f_type == FeedbackType.CORRECT:
+                    ok &= letters[:, i] == code
+                elif f_type == FeedbackType.PRESENT:
+                    ok &= (letters[:, i] != code) & ((present_mask & bit) != 0)
+                elif nonabs_mask & (1 << (code - 65)):
+                    # ABSENT with the letter elsewhere: only ban this position
+                    ok &= letters[:, i] != code
+                else:
+                    # ABSENT everywhere: ban globally
+                    ok &= (present_mask & bit) == 0
+            # Assemble survivors in a single fancy-index step instead of
+            # growing a Python list element by element, and prune the encoded
+            # arrays with the same mask so they stay aligned for the next turn
+            survivors = np.asarray(candidates, dtype=object)[ok].tolist()
+            self._last_candidates = survivors
+            self._last_encoded = (letters[ok], present_mask[ok])
+            return survivors
+
+        return self._filter_python(rules, nonabs_mask, candidates)
+
+    @staticmethod
+    def _encode_candidates(
+        candidates: list[str],
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """Encode candidates as a uint8 letter matrix plus presence bitmasks.
+
+        Returns None when candidates cannot be encoded (empty list, non-ASCII
+        or mixed-length words), in which case the caller falls back to the
+        pure-Python filter.
+        """
+        if not candidates:
+            return None
+        joined = "".join(candidates)
+        if len(joined) != WORD_LENGTH * len(candidates):
+            return None
+        try:
+            flat = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+        except UnicodeEncodeError:
+            return None
+        # Candidates come from the lexicon, which normalizes to uppercase at
+        # load time, so no case folding is needed here
+        letters = flat.reshape(len(candidates), WORD_LENGTH)
+        present_mask = np.bitwise_or.reduce(
+            np.uint32(1) << (letters.astype(np.uint32) - ord("A")), axis=1
+        )
+        return letters, present_mask
+
+    def _filter_python(
+        self,
+        rules: list[tuple[int, str, FeedbackType]],
+        nonabs_mask: int,
+        candidates: list[str],
+    ) -> list[str]:
+        """Pure-Python fallback applying the same permissive rules.
+
+        Args:
+            rules: Per-position (index, letter, feedback) tuples
+            nonabs_mask: 26-bit mask of letters with a non-absent occurrence
+            candidates: Candidate words to filter
+        """
+        # Resolve every rule to its concrete check once, so the per-candidate
+        # loop touches only local lists — no enum comparisons or dict lookups
+        correct_rules: list[tuple[int, str]] = []
+        present_rules: list[tuple[int, str]] = []
+        banned_positions: list[tuple[int, str]] = []
+        banned_letters: list[str] = []
+        for i, g_ch, f_type in rules:
+            if f_type is FeedbackType.CORRECT:
+                correct_rules.append((i, g_ch))
+            elif f_type is FeedbackType.PRESENT:
+                present_rules.append((i, g_ch))
+            elif nonabs_mask & (1 << (ord(g_ch) - 65)):
+                # ABSENT with the letter elsewhere: only ban this position
+                banned_positions.append((i, g_ch))
             else:
-                letter_has_non_absent.setdefault(g_ch, False)
+                # ABSENT everywhere: ban globally
+                banned_letters.append(g_ch)
 
-        for cand in candidates:
-            cand_u = cand.upper()
-            if len(cand_u) != WORD_LENGTH:
-                continue
+        out: list[str] = []
 
-            # Pass 1: enforce CORRECT
+        # Candidates are lexicon words, already uppercased and length-checked
+        # at load time, so no per-candidate normalization is needed
+        for cand_u in candidates:
             ok = True
-            for i, (g_ch, f_type) in enumerate(zip(guess, fb, strict=False)):
-                if f_type == FeedbackType.CORRECT and cand_u[i] != g_ch:
+            for i, g_ch in correct_rules:
+                if cand_u[i] != g_ch:
                     ok = False
                     break
             if not ok:
                 continue
 
-            # Pass 2: enforce PRESENT/ABSENT with permissive rules
-            for i, (g_ch, f_type) in enumerate(zip(guess, fb, strict=False)):
-                if f_type == FeedbackType.PRESENT:
-                    if cand_u[i] == g_ch or g_ch not in cand_u:
+            for i, g_ch in present_rules:
+                if cand_u[i] == g_ch or g_ch not in cand_u:
+                    ok = False
+                    break
+            if ok:
+                for i, g_ch in banned_positions:
+                    if cand_u[i] == g_ch:
+                        ok = False
+                        break
+            if ok:
+                for g_ch in banned_letters:
+                    if g_ch in cand_u:
                         ok = False
                         break
-                elif f_type == FeedbackType.ABSENT:
-                    if letter_has_non_absent.get(g_ch, False):
-                        if cand_u[i] == g_ch:
-                            ok = False
-                            break
-                    else:
-                        if g_ch in cand_u:
-                            ok = False
-                            break
             if ok:
-                out.append(cand)
+                out.append(cand_u)
 
         return out
@@ -1,5 +1,7 @@
 """Game coordinator for managing game flow and delegating to services."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from config.settings import Settings
@@ -11,6 +13,8 @@ from core.services.game_summary_service import GameSummaryService
 from core.services.guess_analysis_service import GuessAnalysis, GuessAnalysisService
 from utils.logging_config import get_logger
 
+logger = get_logger(__name__)
+
 
 class GameCoordinator:
     """Simplified coordinator that delegates to services."""
@@ -32,12 +36,28 @@ class GameCoordinator:
             guess_analysis_service: Service for analyzing guesses
             settings: Application settings
         """
-        self.handlers: dict[str, BaseGameHandler] = handler_factory.create_handlers()
+        # Handlers are built lazily per mode; most invocations use exactly one
+        self._handler_factory = handler_factory
+        self._handlers: dict[str, BaseGameHandler] = {}
         self.summary_service = summary_service
         self.benchmark_service = benchmark_service
         self.guess_analysis_service = guess_analysis_service
         self.settings = settings
-        self.logger = get_logger(__name__)
+
+    def _get_handler(self, mode: str) -> BaseGameHandler:
+        """Get the handler for a mode, creating it on first use.
+
+        Args:
+            mode: Mode name - "daily", "random", "word", or "offline"
+
+        Returns:
+            Cached handler instance for the mode
+        """
+        handler = self._handlers.get(mode)
+        if handler is None:
+            handler = self._handler_factory.create_handler(mode)
+            self._handlers[mode] = handler
+        return handler
 
     def solve_daily_puzzle(self) -> GameSummary:
         """Solve daily puzzle - delegate to handler.
@@ -45,7 +65,7 @@ class GameCoordinator:
         Returns:
             Game summary with results
         """
-        daily_handler = self.handlers["daily"]
+        daily_handler = self._get_handler("daily")
         return daily_handler.run_game()
 
     def play_random_game(self) -> SimulationResult:
@@ -54,7 +74,7 @@ class GameCoordinator:
         Returns:
             Simulation results
         """
-        random_handler = self.handlers["random"]
+        random_handler = self._get_handler("random")
         return random_handler.run_game()
 
     def play_word_target(self, target_answer: str) -> SimulationResult:
@@ -66,7 +86,7 @@ class GameCoordinator:
         Returns:
             Simulation results
         """
-        word_handler = self.handlers["word"]
+        word_handler = self._get_handler("word")
         return word_handler.run_game(target_answer)  # type: ignore
 
     def simulate_game(
@@ -81,9 +101,31 @@ class GameCoordinator:
         Returns:
             Simulation results
         """
-        offline_handler = self.handlers["offline"]
+        offline_handler = self._get_handler("offline")
         return offline_handler.run_game(target_answer, game_id)  # type: ignore
 
+    def simulate_games(
+        self, target_answers: list[str], max_workers: int | None = None
+    ) -> list[SimulationResult]:
+        """Simulate many games concurrently against known targets.
+
+        Each game is independent and compute-bound in the solver's NumPy
+        kernels (which release the GIL), so a full evaluation sweep across
+        many answers runs games in parallel threads. A display-less handler
+        is used to keep concurrent games from interleaving console output.
+
+        Args:
+            target_answers: Target words, one game each
+            max_workers: Thread count (default: CPU count, capped at 8)
+
+        Returns:
+            Simulation results aligned with target_answers
+        """
+        handler = self._handler_factory.create_quiet_offline_handler()
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(handler.run_game, target_answers))
+
     def analyze_guess(
         self, guess: str, possible_answers: list[str] | None = None
     ) -> GuessAnalysis:
@@ -98,6 +140,20 @@ class GameCoordinator:
         """
         return self.guess_analysis_service.analyze_guess(guess, possible_answers)
 
+    def analyze_guesses(
+        self, guesses: list[str], possible_answers: list[str] | None = None
+    ) -> list[GuessAnalysis]:
+        """Analyze many guesses in one batch - delegate to service.
+
+        Args:
+            guesses: The words to analyze
+            possible_answers: Optional list of possible answers
+
+        Returns:
+            Analysis results aligned with guesses
+        """
+        return self.guess_analysis_service.analyze_guesses(guesses, possible_answers)
+
     def run_online_benchmark(self, **kwargs) -> dict[str, Any]:
         """Run benchmark - delegate to service.
 
@@ -4,46 +4,42 @@ This module contains all application constants to avoid magic numbers and string
 scattered throughout the codebase.
 """
 
+from typing import Final
+
 # Game Configuration
-MAX_TURNS = 6
-WORD_LENGTH = 5
-DEFAULT_TIME_BUDGET = 5.0
-OPTIMAL_FIRST_GUESS = "SALET"
+MAX_TURNS: Final[int] = 6
+WORD_LENGTH: Final[int] = 5
+DEFAULT_TIME_BUDGET: Final[float] = 5.0
+OPTIMAL_FIRST_GUESS: Final[str] = "SALET"
 
 # API Configuration
-DEFAULT_API_BASE_URL = "https://wordle.votee.dev:8000"
-DEFAULT_API_TIMEOUT = 30
-DEFAULT_API_RETRY_ATTEMPTS = 3
+DEFAULT_API_BASE_URL: Final[str] = "https://wordle.votee.dev:8000"
+DEFAULT_API_TIMEOUT: Final[int] = 30
+DEFAULT_API_RETRY_ATTEMPTS: Final[int] = 3
 
 # Solver Configuration
-TIME_BUDGET_BUFFER = 0.8  # Use 80% of time budget to account for overhead
-DEFAULT_MAX_WORKERS = 8
+TIME_BUDGET_BUFFER: Final[float] = 0.8  # Use 80% of time budget to account for overhead
+DEFAULT_MAX_WORKERS: Final[int] = 8
+
+# Upper bound on concurrent API calls from one client; the HTTP connection
+# pool is sized to match so parallel callers never queue on a socket
+TARGET_PROBE_MAX_WORKERS: Final[int] = 16
 
 # Logging Configuration
-DEFAULT_LOG_LEVEL = "INFO"
-DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_LOG_LEVEL: Final[str] = "INFO"
+DEFAULT_LOG_FORMAT: Final[str] = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Performance Configuration
-ENABLE_PERFORMANCE_METRICS = True
+ENABLE_PERFORMANCE_METRICS: Final[bool] = True
 
 # Development Configuration
-DEBUG_MODE = False
-SIMULATION_MODE = False
-
-
-# Feedback Types
-class FeedbackType:
-    """Constants for feedback types."""
-
-    CORRECT = "+"
-    PRESENT = "o"
-    ABSENT = "-"
-
+DEBUG_MODE: Final[bool] = False
+SIMULATION_MODE: Final[bool] = False
 
 # Display Configuration
-DEFAULT_SHOW_RICH_DISPLAY = True
-DEFAULT_SHOW_DETAILED = True
+DEFAULT_SHOW_RICH_DISPLAY: Final[bool] = True
+DEFAULT_SHOW_DETAILED: Final[bool] = True
 
 # File Paths
-DEFAULT_ANSWERS_FILE = "infrastructure/data/answers.txt"
-DEFAULT_ALLOWED_FILE = "infrastructure/data/allowed.txt"
+DEFAULT_ANSWERS_FILE: Final[str] = "infrastructure/data/answers.txt"
+DEFAULT_ALLOWED_FILE: Final[str] = "infrastructure/data/allowed.txt"
@@ -1,87 +1,147 @@
 """Domain models for the Wordle bot."""
 
-from enum import Enum
-
-from pydantic import BaseModel, Field
+import sys
+from dataclasses import dataclass, field
+from enum import IntEnum
 
 from core.domain.constants import MAX_TURNS, WORD_LENGTH
 
 
-class FeedbackType(Enum):
-    """Feedback types for each letter position."""
+class FeedbackType(IntEnum):
+    """Feedback types for each letter position.
+
+    Values are the base-3 digits used in packed pattern codes, so enum
+    members feed directly into integer pattern math.
+    """
+
+    CORRECT = 2  # Green: correct letter in correct position
+    PRESENT = 1  # Yellow: correct letter in wrong position
+    ABSENT = 0  # Gray: letter not in the word
+
+
+# Module-level map used to parse API feedback characters; built once so the
+# hot from_api_response conversion allocates nothing beyond the feedback list
+_FEEDBACK_MAP = {
+    "+": FeedbackType.CORRECT,
+    "o": FeedbackType.PRESENT,
+    "x": FeedbackType.ABSENT,
+    "-": FeedbackType.ABSENT,
+}
+
+_CORRECT_PATTERN = "+++++"
+
+# Memoized decode of API result strings. Only valid strings are cached, so
+# the table is bounded by the 4^5 possible feedback strings; after warm-up
+# every conversion is a single dict hit and all equal feedback tuples are
+# shared objects.
+_DECODED_RESULTS: dict[str, tuple[tuple[FeedbackType, ...], bool]] = {}
 
-    CORRECT = "+"  # Green: correct letter in correct position
-    PRESENT = "o"  # Yellow: correct letter in wrong position
-    ABSENT = "-"  # Gray: letter not in the word
+# Flyweight pool of all 243 feedback patterns indexed by base-3 code (digit k
+# encodes position k, least-significant first). Every pattern string handed
+# out by the bot is one of these interned objects, so benchmarks never
+# accumulate duplicate copies and equality checks are pointer compares.
+PATTERN_STRINGS: tuple[str, ...] = tuple(
+    sys.intern("".join("-o+"[(code // 3**k) % 3] for k in range(WORD_LENGTH)))
+    for code in range(3**WORD_LENGTH)
+)
 
 
-class LetterFeedback(BaseModel):
+@dataclass(slots=True)
+class LetterFeedback:
     """Feedback for a single letter position."""
 
-    letter: str = Field(..., min_length=1, max_length=1)
+    letter: str
     feedback: FeedbackType
-    position: int = Field(..., ge=0, le=WORD_LENGTH - 1)
+    position: int
 
 
-class GuessResult(BaseModel):
-    """Result of a single guess."""
+@dataclass(slots=True)
+class GuessResult:
+    """Result of a single guess.
 
-    guess: str = Field(..., min_length=WORD_LENGTH, max_length=WORD_LENGTH)
-    feedback: list[FeedbackType] = Field(
-        ..., min_length=WORD_LENGTH, max_length=WORD_LENGTH
-    )
+    Instances are built from trusted internal code; from_api_response is
+    the single validating entry point for external feedback strings.
+    """
+
+    guess: str
+    feedback: tuple[FeedbackType, ...]
     is_correct: bool = False
 
+    # Cached pattern forms; feedback is never mutated after construction
+    _pattern_string: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _pattern_code: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_api_response(cls, guess: str, result_string: str) -> "GuessResult":
         """Create GuessResult from API response format (e.g., '++x--')."""
-        feedback_map = {
-            "+": FeedbackType.CORRECT,
-            "o": FeedbackType.PRESENT,
-            "x": FeedbackType.ABSENT,
-            "-": FeedbackType.ABSENT,
-        }
+        decoded = _DECODED_RESULTS.get(result_string)
+        if decoded is None:
+            if len(result_string) != 5:
+                raise ValueError(f"Invalid result string length: {len(result_string)}")
 
-        if len(result_string) != 5:
-            raise ValueError(f"Invalid result string length: {len(result_string)}")
+            try:
+                feedback = tuple(_FEEDBACK_MAP[char] for char in result_string)
+            except KeyError as e:
+                raise ValueError(f"Invalid feedback character: {e.args[0]}") from None
 
-        feedback = []
-        for char in result_string:
-            if char not in feedback_map:
-                raise ValueError(f"Invalid feedback character: {char}")
-            feedback.append(feedback_map[char])
+            decoded = (feedback, result_string == _CORRECT_PATTERN)
+            _DECODED_RESULTS[result_string] = decoded
 
-        is_correct = all(f == FeedbackType.CORRECT for f in feedback)
+        feedback, is_correct = decoded
 
-        return cls(guess=guess.upper(), feedback=feedback, is_correct=is_correct)
+        # Intern the guess so repeated words across benchmark games share one
+        # string object
+        return cls(
+            guess=sys.intern(guess.upper()), feedback=feedback, is_correct=is_correct
+        )
 
     def to_pattern_string(self) -> str:
-        """Convert feedback to pattern string for entropy calculations."""
-        pattern_map = {
-            FeedbackType.CORRECT: "+",
-            FeedbackType.PRESENT: "o",
-            FeedbackType.ABSENT: "-",
-        }
-        return "".join(pattern_map[f] for f in self.feedback)
+        """Convert feedback to pattern string for entropy calculations.
 
+        The string is computed once and cached; callers in the filter and
+        analytics hot loops may call this repeatedly for the same result.
+        """
+        if self._pattern_string is None:
+            self._pattern_string = PATTERN_STRINGS[self.pattern_code_base3]
+        return self._pattern_string
 
-class GameState(BaseModel):
+    @property
+    def pattern_code_base3(self) -> int:
+        """Feedback packed as a base-3 integer in [0, 243).
+
+        Digit k (least-significant first) encodes position k with
+        2=correct, 1=present, 0=absent; comparable against the codes
+        produced by SolverEngine's feedback simulation.
+        """
+        if self._pattern_code is None:
+            self._pattern_code = sum(
+                f * 3**i for i, f in enumerate(self.feedback)
+            )
+        return self._pattern_code
+
+
+@dataclass(slots=True)
+class GameState:
     """Current state of the Wordle game."""
 
-    turn: int = Field(default=1, ge=1, le=MAX_TURNS)
-    guesses: list[GuessResult] = Field(default_factory=list)
-    possible_answers: list[str] = Field(default_factory=list)
+    turn: int = 1
+    guesses: list[GuessResult] = field(default_factory=list)
+    possible_answers: list[str] = field(default_factory=list)
     is_solved: bool = False
     is_failed: bool = False
 
     def add_guess(self, guess_result: GuessResult):
         """Add a new guess result to the game state."""
         self.guesses.append(guess_result)
-        self.turn = len(self.guesses) + 1
+        self.turn += 1
 
         if guess_result.is_correct:
             self.is_solved = True
-        elif self.turn > 6:
+        elif self.turn > MAX_TURNS:
             self.is_failed = True
 
     def get_last_guess(self) -> GuessResult | None:
@@ -91,7 +151,8 @@ class GameState(BaseModel):
     @property
     def remaining_turns(self) -> int:
         """Get number of turns remaining."""
-        return max(0, 6 - len(self.guesses))
+        # turn - 1 equals the number of guesses taken so far
+        return max(0, MAX_TURNS - self.turn + 1)
 
     @property
     def is_game_over(self) -> bool:
@@ -99,10 +160,19 @@ class GameState(BaseModel):
         return self.is_solved or self.is_failed
 
 
-class EntropyCalculation(BaseModel):
+@dataclass(slots=True)
+class EntropyCalculation:
     """Result of entropy calculation for a potential guess."""
 
-    word: str = Field(..., min_length=5, max_length=5)
-    entropy: float = Field(..., ge=0.0)
-    pattern_count: int = Field(..., ge=1)
+    word: str
+    entropy: float
+    pattern_count: int
     calculation_time: float | None = None
+
+    def __post_init__(self) -> None:
+        if len(self.word) != WORD_LENGTH:
+            raise ValueError(f"Word must be exactly {WORD_LENGTH} letters: {self.word}")
+        if self.entropy < 0.0:
+            raise ValueError(f"Entropy must be non-negative: {self.entropy}")
+        if self.pattern_count < 1:
+            raise ValueError(f"Pattern count must be at least 1: {self.pattern_count}")
@@ -63,11 +63,6 @@ class GameSummary(TypedDict):
     timestamp: float
 
 
-class SimulationResult(TypedDict):
-    """Type definition for simulation result."""
-
-    game_result: GameResult
-    performance_metrics: PerformanceMetrics
-    guess_history: list[GuessHistoryItem]
-    lexicon_stats: LexiconStats
-    timestamp: float
+# Simulation results share the final game summary shape; the alias keeps the
+# mode-specific name at call sites without duplicating the definition
+SimulationResult = GameSummary
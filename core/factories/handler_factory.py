@@ -37,36 +37,72 @@ class HandlerFactory:
         self.lexicon = lexicon
         self.display = display
         self.settings = settings
+        self._cache: dict[str, BaseGameHandler] = {}
 
-    def create_handlers(self) -> dict[str, BaseGameHandler]:
-        """Create all game mode handlers.
+    def create_handler(self, mode: str) -> BaseGameHandler:
+        """Create a single game mode handler on demand.
+
+        Handlers are stateless between games, so each mode is built once
+        and the same instance is returned on subsequent calls.
+
+        Args:
+            mode: Mode name - "daily", "random", "word", or "offline"
 
         Returns:
-            Dictionary mapping mode names to handler instances
+            Handler instance for the requested mode
+
+        Raises:
+            ValueError: If the mode is not recognized
         """
-        return {
-            "daily": DailyHandler(
-                self.game_client,
-                self.solver_engine,
-                self.lexicon,
-                self.display,
-                self.settings,
-            ),
-            "random": RandomHandler(
-                self.game_client,
-                self.solver_engine,
-                self.lexicon,
-                self.display,
-                self.settings,
-            ),
-            "word": WordHandler(
+        handler = self._cache.get(mode)
+        if handler is not None:
+            return handler
+
+        if mode == "offline":
+            handler = OfflineHandler(
+                self.solver_engine, self.lexicon, self.display, self.settings
+            )
+        else:
+            handler_classes: dict[str, type[BaseGameHandler]] = {
+                "daily": DailyHandler,
+                "random": RandomHandler,
+                "word": WordHandler,
+            }
+            if mode not in handler_classes:
+                raise ValueError(f"Unknown handler mode: {mode}")
+            handler = handler_classes[mode](
                 self.game_client,
                 self.solver_engine,
                 self.lexicon,
                 self.display,
                 self.settings,
-            ),
-            "offline": OfflineHandler(
-                self.solver_engine, self.lexicon, self.display, self.settings
-            ),
+            )
+
+        self._cache[mode] = handler
+        return handler
+
+    def create_quiet_offline_handler(self) -> BaseGameHandler:
+        """Create a display-less offline handler for batch simulation.
+
+        Concurrent sweeps would interleave rich console output, so batch
+        callers get a dedicated handler with the display disabled. Cached
+        like the mode handlers since it is equally stateless.
+        """
+        handler = self._cache.get("offline_quiet")
+        if handler is None:
+            handler = OfflineHandler(
+                self.solver_engine, self.lexicon, None, self.settings
+            )
+            self._cache["offline_quiet"] = handler
+        return handler
+
+    def create_handlers(self) -> dict[str, BaseGameHandler]:
+        """Create all game mode handlers.
+
+        Returns:
+            Dictionary mapping mode names to handler instances
+        """
+        return {
+            mode: self.create_handler(mode)
+            for mode in ("daily", "random", "word", "offline")
         }
@@ -1,13 +1,41 @@
 """Benchmark service for running benchmarks and analytics."""
 
+import asyncio
+import random
+from collections.abc import Callable
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, Any
 
+from core.algorithms.analytics_engine import AnalyticsEngine
 from core.algorithms.benchmark_engine import BenchmarkEngine
+from core.domain.constants import DEFAULT_MAX_WORKERS
 
 if TYPE_CHECKING:
     from core.algorithms.orchestrator import Orchestrator
 from utils.logging_config import get_logger
 
+logger = get_logger(__name__)
+
+# Per-mode game players, resolved once per benchmark run instead of
+# branching on the mode string inside every game
+_MODE_PLAYERS: dict[str, Callable[["Orchestrator", str], Any]] = {
+    "daily": lambda orch, target_word: orch.solve_daily_puzzle(),
+    "random": lambda orch, target_word: orch.play_random_game(),
+    "word": lambda orch, target_word: orch.play_word_target(target_word),
+}
+
+# Shared failure shape for the error path; per-game results only add the
+# varying target_word and error fields on top. The empty guesses tuple is
+# immutable, so sharing it across results is safe.
+_FAILED_TEMPLATE: dict[str, Any] = {
+    "won": False,
+    "guesses_used": 6,
+    "guesses": (),
+    "game_duration": 0.0,
+    "final_state": {},
+    "success": False,
+}
+
 
 class BenchmarkService:
     """Service for running benchmarks and analytics."""
@@ -19,7 +47,22 @@ class BenchmarkService:
             orchestrator: The orchestrator instance
         """
         self.orchestrator = orchestrator
-        self.logger = get_logger(__name__)
+
+    @cached_property
+    def benchmark_engine(self) -> BenchmarkEngine:
+        """Lazily created benchmark engine shared across invocations."""
+        # Online games are network-bound, so the pool is sized to the same
+        # concurrency the HTTP connection pool is provisioned for
+        settings = self.orchestrator.settings
+        return BenchmarkEngine(
+            solver_time_budget=settings.SOLVER_TIME_BUDGET_SECONDS,
+            max_workers=settings.SOLVER_MAX_WORKERS or DEFAULT_MAX_WORKERS,
+        )
+
+    @cached_property
+    def analytics_engine(self) -> AnalyticsEngine:
+        """Lazily created analytics engine shared across invocations."""
+        return AnalyticsEngine()
 
     def run_online_benchmark(
         self,
@@ -39,88 +82,30 @@ class BenchmarkService:
         Returns:
             Benchmark results with online API data
         """
+        play_fn = _MODE_PLAYERS.get(mode)
+        if play_fn is None:
+            raise ValueError(f"Invalid mode: {mode}")
+
         # Validate daily mode benchmark
         if mode == "daily" and num_games > 1:
-            self.logger.warning(
-                f"Daily mode benchmark with {num_games} games is not meaningful. "
-                "Daily puzzle only has one word per day. Limiting to 1 game."
+            logger.warning(
+                "Daily mode benchmark with %d games is not meaningful. "
+                "Daily puzzle only has one word per day. Limiting to 1 game.",
+                num_games,
             )
             num_games = 1
 
-        self.logger.info(
-            f"Starting online benchmark with {num_games} games using {mode} API"
-        )
+        logger.info("Starting online benchmark with %d games using %s API", num_games, mode)
 
-        # Create benchmark engine with online orchestrator
-        benchmark = BenchmarkEngine(
-            solver_time_budget=self.orchestrator.settings.SOLVER_TIME_BUDGET_SECONDS,
-            max_workers=4,
-        )
+        # Reuse the cached benchmark engine across invocations
+        benchmark = self.benchmark_engine
 
-        # Override the benchmark's game playing logic to use online APIs
-        def online_play_game(target_word: str) -> dict[str, Any]:
-            """Play a single game using online API."""
-            try:
-                if mode == "daily":
-                    result = self.orchestrator.solve_daily_puzzle()
-                elif mode == "random":
-                    result = self.orchestrator.play_random_game()
-                elif mode == "word":
-                    result = self.orchestrator.play_word_target(target_word)
-                else:
-                    raise ValueError(f"Invalid mode: {mode}")
-
-                # Convert to benchmark format per mode/result shape
-                if (
-                    mode == "daily"
-                    and isinstance(result, dict)
-                    and "game_result" in result
-                ):
-                    game_result = result["game_result"]
-                    perf = result.get("performance_metrics", {})
-                    won = bool(game_result.get("solved", False))
-                    turns = int(game_result.get("total_turns", 0))
-                    return {
-                        "target_word": "daily",
-                        "won": won,
-                        "guesses_used": turns,
-                        "guesses": [],
-                        "game_duration": float(
-                            perf.get("total_game_time_seconds", 0.0)
-                        ),
-                        "final_state": result,
-                        "success": won,
-                    }
-                else:
-                    # Handle SimulationResult format
-                    game_result = result.get("game_result", {})
-                    performance_metrics = result.get("performance_metrics", {})
-                    return {
-                        "target_word": game_result.get("final_answer", "unknown"),
-                        "won": game_result.get("solved", False),
-                        "guesses_used": game_result.get("total_turns", 0),
-                        "guesses": [],
-                        "game_duration": performance_metrics.get(
-                            "total_game_time_seconds", 0.0
-                        ),
-                        "final_state": result,
-                        "success": game_result.get("solved", False),
-                    }
-            except Exception as e:
-                self.logger.error(f"Error in online game: {e}")
-                return {
-                    "target_word": target_word,
-                    "won": False,
-                    "guesses_used": 6,
-                    "guesses": [],
-                    "game_duration": 0.0,
-                    "final_state": {},
-                    "success": False,
-                    "error": str(e),
-                }
-
-        # Replace the game playing method
-        benchmark._play_single_game = online_play_game
+        # Resolve the player and result shaper once; each game is then a bound
+        # call with no mode branching or closure rebuilding
+        shape_fn = (
+            self._shape_daily_result if mode == "daily" else self._shape_simulation_result
+        )
+        online_play_game = partial(self._play_online_game, play_fn, shape_fn)
 
         # Run benchmark
         if mode == "word" and target_words:
@@ -128,12 +113,14 @@ class BenchmarkService:
                 num_games=len(target_words),
                 target_words=target_words,
                 show_progress=show_progress,
+                play_game=online_play_game,
             )
         else:
             result = benchmark.run_benchmark(
                 num_games=num_games,
                 target_words=target_words,
                 show_progress=show_progress,
+                play_game=online_play_game,
             )
 
         # Add online-specific metadata
@@ -142,6 +129,146 @@ class BenchmarkService:
 
         return result
 
+    async def run_online_benchmark_async(
+        self,
+        num_games: int = 100,
+        mode: str = "random",
+        target_words: list[str] | None = None,
+        max_concurrent: int = 8,
+    ) -> dict[str, Any]:
+        """Run an online benchmark from an asyncio event loop.
+
+        Games still use the blocking HTTP client, so each one runs in a
+        worker thread via asyncio.to_thread; a semaphore caps how many are
+        in flight at once. Useful for callers that already live in an event
+        loop and cannot block on run_online_benchmark.
+
+        Args:
+            num_games: Number of games to play
+            mode: API mode - "daily", "random", or "word"
+            target_words: Specific words for "word" mode (if None, random selection)
+            max_concurrent: Maximum games in flight at once
+
+        Returns:
+            Benchmark results with online API data
+        """
+        play_fn = _MODE_PLAYERS.get(mode)
+        if play_fn is None:
+            raise ValueError(f"Invalid mode: {mode}")
+
+        if mode == "daily" and num_games > 1:
+            logger.warning(
+                "Daily mode benchmark only has one word per day. Limiting to 1 game."
+            )
+            num_games = 1
+
+        if target_words is None:
+            all_answers = self.orchestrator.lexicon.answers
+            target_words = random.sample(all_answers, min(num_games, len(all_answers)))
+        else:
+            target_words = target_words[:num_games]
+
+        shape_fn = (
+            self._shape_daily_result if mode == "daily" else self._shape_simulation_result
+        )
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def play_one(target_word: str) -> dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._play_online_game, play_fn, shape_fn, target_word
+                )
+
+        results = list(
+            await asyncio.gather(*(play_one(word) for word in target_words))
+        )
+
+        compiled = self.benchmark_engine._compile_results(results, target_words)
+        compiled["api_mode"] = mode
+        compiled["online_benchmark"] = True
+        return compiled
+
+    def _play_online_game(
+        self,
+        play_fn: "Callable[[Orchestrator, str], Any]",
+        shape_fn: Callable[[Any], dict[str, Any]],
+        target_word: str,
+    ) -> dict[str, Any]:
+        """Play a single online game and shape its result for the benchmark.
+
+        Args:
+            play_fn: Mode-specific player resolved before the game loop
+            shape_fn: Mode-specific result shaper resolved before the game loop
+            target_word: Target word for "word" mode games
+
+        Returns:
+            Game result in benchmark format
+        """
+        try:
+            result = play_fn(self.orchestrator, target_word)
+            return shape_fn(result)
+        except Exception as e:
+            logger.error("Error in online game: %s", e)
+            return {**_FAILED_TEMPLATE, "target_word": target_word, "error": str(e)}
+
+    @staticmethod
+    def _shape_daily_result(result: Any) -> dict[str, Any]:
+        """Convert a GameSummary from daily mode to benchmark format.
+
+        The summary schema is fixed (GameSummary TypedDict), so the fast path
+        indexes directly; only malformed results pay for default lookups.
+        """
+        try:
+            game_result = result["game_result"]
+            won = bool(game_result["solved"])
+            turns = int(game_result["total_turns"])
+            duration = float(result["performance_metrics"]["total_game_time_seconds"])
+        except (KeyError, TypeError):
+            game_result = result.get("game_result") or {}
+            perf = result.get("performance_metrics") or {}
+            won = bool(game_result.get("solved", False))
+            turns = int(game_result.get("total_turns", 0))
+            duration = float(perf.get("total_game_time_seconds", 0.0))
+        return {
+            "target_word": "daily",
+            "won": won,
+            "guesses_used": turns,
+            "guesses": [],
+            "game_duration": duration,
+            "final_state": result,
+            "success": won,
+        }
+
+    @staticmethod
+    def _shape_simulation_result(result: Any) -> dict[str, Any]:
+        """Convert a SimulationResult to benchmark format.
+
+        Indexes the fixed SimulationResult schema directly on the fast path,
+        falling back to permissive lookups only for malformed results.
+        """
+        try:
+            game_result = result["game_result"]
+            won = game_result["solved"]
+            turns = game_result["total_turns"]
+            target_word = game_result["final_answer"]
+            duration = result["performance_metrics"]["total_game_time_seconds"]
+        except (KeyError, TypeError):
+            game_result = result.get("game_result") or {}
+            perf = result.get("performance_metrics") or {}
+            won = game_result.get("solved", False)
+            turns = game_result.get("total_turns", 0)
+            target_word = game_result.get("final_answer", "unknown")
+            duration = perf.get("total_game_time_seconds", 0.0)
+        return {
+            "target_word": target_word,
+            "won": won,
+            "guesses_used": turns,
+            "guesses": [],
+            "game_duration": duration,
+            "final_state": result,
+            "success": won,
+        }
+
     def run_online_analytics(
         self,
         analysis_type: str = "strategy",
@@ -158,19 +285,24 @@ class BenchmarkService:
         Returns:
             Analytics results with online API data
         """
-        from core.algorithms.analytics_engine import AnalyticsEngine
-
-        self.logger.info(
-            f"Running online {analysis_type} analysis with {sample_size} samples using {mode} API"
+        logger.info(
+            "Running online %s analysis with %d samples using %s API",
+            analysis_type,
+            sample_size,
+            mode,
         )
 
-        # Create analytics engine
-        analytics = AnalyticsEngine()
+        # Reuse the cached analytics engine across invocations
+        analytics = self.analytics_engine
 
         # For online analytics, we need to collect data from actual API games
         if analysis_type == "difficulty":
-            # Run sample games to collect difficulty data
-            sample_results = []
+            # Run sample games, collecting columns (struct-of-arrays) so the
+            # analytics aggregation can reduce them vectorized
+            sample_words: list[str] = []
+            sample_solved: list[bool] = []
+            sample_turns: list[int] = []
+            sample_times: list[float] = []
             for i in range(min(sample_size, 20)):  # Limit to avoid too many API calls
                 try:
                     if mode == "daily":
@@ -182,25 +314,24 @@ class BenchmarkService:
                         word: str = self.orchestrator.lexicon.get_random_answer()
                         result = self.orchestrator.play_word_target(word)
 
-                    sample_results.append(
-                        {
-                            "target_word": result.get("target_answer", "unknown"),
-                            "solved": result.get("solved", False),
-                            "turns_used": result.get("turns_used", 0),
-                            "simulation_time": result.get("simulation_time", 0.0),
-                        }
-                    )
+                    sample_words.append(result.get("target_answer", "unknown"))
+                    sample_solved.append(bool(result.get("solved", False)))
+                    sample_turns.append(int(result.get("turns_used", 0)))
+                    sample_times.append(float(result.get("simulation_time", 0.0)))
                 except Exception as e:
-                    self.logger.warning(f"Failed to collect sample {i}: {e}")
+                    logger.warning("Failed to collect sample %d: %s", i, e)
                     continue
 
             # Analyze the collected data
             result = {
                 "analysis_type": "online_word_difficulty",
                 "api_mode": mode,
-                "sample_size": len(sample_results),
-                "results": analytics.analyze_word_difficulty_from_results(
-                    sample_results
+                "sample_size": len(sample_words),
+                "results": analytics.analyze_word_difficulty_from_arrays(
+                    words=sample_words,
+                    solved=sample_solved,
+                    turns=sample_turns,
+                    times=sample_times,
                 ),
             }
         else:
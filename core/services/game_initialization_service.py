@@ -5,6 +5,8 @@ from core.algorithms.state_manager import ApiGameStateManager, GameStateManager
 from infrastructure.api.game_client import WordleAPIError
 from utils.logging_config import get_logger
 
+logger = get_logger(__name__)
+
 
 class GameInitializationService:
     """Service for game initialization logic."""
@@ -16,7 +18,6 @@ class GameInitializationService:
             settings: Application settings
         """
         self.settings = settings
-        self.logger = get_logger(__name__)
 
     def initialize_standard_game(self) -> GameStateManager:
         """Initialize standard game state manager.
@@ -30,10 +31,10 @@ class GameInitializationService:
         try:
             # Initialize game state manager with all possible answers
             game_state_manager = GameStateManager(app_settings=self.settings)
-            self.logger.info(msg="Game initialization completed (standard mode)")
+            logger.info(msg="Game initialization completed (standard mode)")
             return game_state_manager
         except WordleAPIError as e:
-            self.logger.error(msg=f"Failed to initialize game: {e}")
+            logger.error("Failed to initialize game: %s", e)
             raise
 
     def initialize_daily_game(self) -> ApiGameStateManager:
@@ -45,10 +46,10 @@ class GameInitializationService:
         try:
             # Initialize daily game state manager
             daily_game_manager = ApiGameStateManager(app_settings=self.settings)
-            self.logger.info(msg="Game initialization completed (daily mode)")
+            logger.info(msg="Game initialization completed (daily mode)")
             return daily_game_manager
         except Exception as e:
-            self.logger.error(msg=f"Failed to initialize daily game: {e}")
+            logger.error("Failed to initialize daily game: %s", e)
             raise
 
     def validate_game_initialization(self, game_manager: GameStateManager) -> bool:
@@ -61,6 +62,6 @@ class GameInitializationService:
             True if initialization is valid
         """
         if not game_manager:
-            self.logger.error("Game state manager is not initialized")
+            logger.error("Game state manager is not initialized")
             return False
         return True
@@ -7,6 +7,8 @@ from core.domain.types import GameSummary, GuessHistoryItem
 from infrastructure.data.word_lexicon import WordLexicon
 from utils.logging_config import get_logger
 
+logger = get_logger(__name__)
+
 
 class GameSummaryService:
     """Centralized service for generating game summaries."""
@@ -18,7 +20,6 @@ class GameSummaryService:
             lexicon: The word lexicon instance
         """
         self.lexicon = lexicon
-        self.logger = get_logger(__name__)
 
     def generate_summary(
         self,
@@ -36,27 +37,27 @@ class GameSummaryService:
         Returns:
             Comprehensive game summary
         """
-        game_summary = game_state_manager.get_game_summary()
-
-        # Type-safe access to game_summary
-        guess_history: list[GuessHistoryItem] = game_summary["guesses"]
-        remaining_answers: list[str] = game_summary["possible_answers"]
+        # Read the needed pieces directly instead of materializing the full
+        # intermediate summary dict (which also copies fields unused here)
+        guess_history: list[GuessHistoryItem] = game_state_manager.get_guess_history()
+        remaining_answers: list[str] = game_state_manager.get_possible_answers()
 
-        # Get lexicon stats in proper format
+        # Get lexicon stats in proper format (cached on the lexicon)
         lexicon_stats = self.lexicon.get_stats()
 
+        is_solved = game_state_manager.is_solved()
+
         final_summary: GameSummary = {
             "game_result": {
-                "solved": game_state_manager.is_solved(),
+                "solved": is_solved,
                 "failed": game_state_manager.is_failed(),
                 "total_turns": len(guess_history),
                 "final_answer": (guess_history[-1]["guess"] if guess_history else None),
             },
             "performance_metrics": {
-                "total_game_time_seconds": round(number=total_time, ndigits=2),
-                "average_time_per_turn": round(
-                    number=total_time / max(1, len(guess_history)), ndigits=2
-                ),
+                # Stored un-rounded; consumers round at display/serialization
+                "total_game_time_seconds": total_time,
+                "average_time_per_turn": total_time / max(1, len(guess_history)),
                 "remaining_possibilities": remaining_answers,
             },
             "guess_history": guess_history,
@@ -64,17 +65,20 @@ class GameSummaryService:
             "timestamp": time.time(),
         }
 
-        # Log final result
-        if game_state_manager.is_solved():
-            self.logger.info(
-                f"PUZZLE SOLVED! Answer: {final_summary['game_result']['final_answer']} "
-                + f"in {final_summary['game_result']['total_turns']} turns "
-                + f"({final_summary['performance_metrics']['total_game_time_seconds']}s)"
+        # Log final result with %-style args so formatting is skipped when the
+        # level is filtered out (e.g. benchmark runs with logging disabled)
+        if is_solved:
+            logger.info(
+                "PUZZLE SOLVED! Answer: %s in %d turns (%.2fs)",
+                final_summary["game_result"]["final_answer"],
+                final_summary["game_result"]["total_turns"],
+                total_time,
             )
         else:
-            self.logger.warning(
-                f"Puzzle failed after {final_summary['game_result']['total_turns']} turns "
-                + f"({final_summary['performance_metrics']['total_game_time_seconds']}s)"
+            logger.warning(
+                "Puzzle failed after %d turns (%.2fs)",
+                final_summary["game_result"]["total_turns"],
+                total_time,
             )
 
         return final_summary
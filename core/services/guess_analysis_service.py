@@ -6,6 +6,8 @@ from core.algorithms.solver_engine import SolverEngine
 from infrastructure.data.word_lexicon import WordLexicon
 from utils.logging_config import get_logger
 
+logger = get_logger(__name__)
+
 
 class GuessAnalysis(TypedDict):
     """Type definition for guess analysis."""
@@ -31,7 +33,6 @@ class GuessAnalysisService:
         """
         self.solver_engine = solver_engine
         self.lexicon = lexicon
-        self.logger = get_logger(__name__)
 
     def analyze_guess(
         self, guess: str, possible_answers: list[str] | None = None
@@ -45,27 +46,56 @@ class GuessAnalysisService:
         Returns:
             Analysis results including entropy calculation
         """
+        return self.analyze_guesses([guess], possible_answers)[0]
+
+    def analyze_guesses(
+        self, guesses: list[str], possible_answers: list[str] | None = None
+    ) -> list[GuessAnalysis]:
+        """Analyze many guesses against the same answer pool in one batch.
+
+        Computes the feedback-code matrix once via the solver's batch entropy
+        API instead of re-running the per-answer simulation loop per word.
+
+        Args:
+            guesses: The words to analyze
+            possible_answers: Optional list of possible answers. If None, uses all answers.
+
+        Returns:
+            Analysis results aligned with guesses
+        """
+        # Full-lexicon analyses reuse the lexicon's pre-encoded letter matrix
+        answers_matrix = None
         if possible_answers is None:
             possible_answers = self.lexicon.answers
+            answers_matrix = self.lexicon.answers_matrix
 
-        if not self.lexicon.is_valid_guess(guess):
-            raise ValueError(f"'{guess}' is not a valid guess word")
+        # Uppercase each guess once; validation, entropy encoding and the
+        # optimal-first-guess compare all reuse the same string
+        upper_guesses = [guess.upper() for guess in guesses]
+        for guess in upper_guesses:
+            if not self.lexicon.is_valid_guess(guess):
+                raise ValueError(f"'{guess}' is not a valid guess word")
 
-        # Calculate detailed entropy
-        entropy_calc = self.solver_engine.calculate_detailed_entropy(
-            guess, possible_answers
+        entropy_calcs = self.solver_engine.calculate_detailed_entropy_batch(
+            upper_guesses, possible_answers, answers_matrix=answers_matrix
         )
 
-        return {
-            "word": guess,
-            "entropy": entropy_calc.entropy,
-            "pattern_count": entropy_calc.pattern_count,
-            "calculation_time": entropy_calc.calculation_time or 0.0,
-            "possible_answers_count": len(possible_answers),
-            "information_bits": entropy_calc.entropy,
-            "is_optimal_first_guess": guess.upper()
-            == self.solver_engine.OPTIMAL_FIRST_GUESS,
-        }
+        optimal_first_guess = self.solver_engine.OPTIMAL_FIRST_GUESS
+        answers_count = len(possible_answers)
+        return [
+            {
+                "word": guess,
+                "entropy": entropy_calc.entropy,
+                "pattern_count": entropy_calc.pattern_count,
+                "calculation_time": entropy_calc.calculation_time or 0.0,
+                "possible_answers_count": answers_count,
+                "information_bits": entropy_calc.entropy,
+                "is_optimal_first_guess": guess_u == optimal_first_guess,
+            }
+            for guess, guess_u, entropy_calc in zip(
+                guesses, upper_guesses, entropy_calcs, strict=False
+            )
+        ]
 
     def validate_guess(self, guess: str) -> bool:
         """Validate if guess is valid.
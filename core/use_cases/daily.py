@@ -38,7 +38,10 @@ def solve_daily(settings: Settings | None = None) -> GameSummary:
     try:
         orchestrator = _create_orchestrator(settings)
         logger.info("Starting daily puzzle solution")
-        result = orchestrator.solve_daily_puzzle()
+        try:
+            result = orchestrator.solve_daily_puzzle()
+        finally:
+            orchestrator.close()
         logger.info("Daily puzzle solution completed")
         return result
     except Exception as e:
@@ -64,7 +67,10 @@ def benchmark_daily(
     try:
         orchestrator = _create_orchestrator(settings)
         logger.info(f"Starting daily benchmark with {games} games")
-        result = orchestrator.run_online_benchmark(num_games=games, mode="daily")
+        try:
+            result = orchestrator.run_online_benchmark(num_games=games, mode="daily")
+        finally:
+            orchestrator.close()
         logger.info("Daily benchmark completed")
         return result
     except Exception as e:
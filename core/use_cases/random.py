@@ -13,11 +13,17 @@ from core.algorithms.orchestrator import Orchestrator, SimulationResult
 
 def play_random(settings: Settings | None = None) -> SimulationResult:
     orchestrator = Orchestrator(app_settings=settings)
-    return orchestrator.play_random_game()
+    try:
+        return orchestrator.play_random_game()
+    finally:
+        orchestrator.close()
 
 
 def benchmark_random(
     games: int = 20, settings: Settings | None = None
 ) -> dict[str, Any]:
     orchestrator = Orchestrator(app_settings=settings)
-    return orchestrator.run_online_benchmark(num_games=games, mode="random")
+    try:
+        return orchestrator.run_online_benchmark(num_games=games, mode="random")
+    finally:
+        orchestrator.close()
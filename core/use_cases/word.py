@@ -11,4 +11,7 @@ from core.algorithms.orchestrator import Orchestrator, SimulationResult
 
 def play_word_target(target: str, settings: Settings | None = None) -> SimulationResult:
     orchestrator = Orchestrator(app_settings=settings)
-    return orchestrator.play_word_target(target)
+    try:
+        return orchestrator.play_word_target(target)
+    finally:
+        orchestrator.close()
@@ -1,5 +1,6 @@
 """GameClient - API adapter for Wordle game communication."""
 
+import threading
 from typing import Any
 
 import requests
@@ -12,6 +13,11 @@ from tenacity import (
 
 from config.settings import Settings
 from config.settings import settings as default_settings
+from core.domain.constants import (
+    DEFAULT_API_RETRY_ATTEMPTS,
+    DEFAULT_MAX_WORKERS,
+    TARGET_PROBE_MAX_WORKERS,
+)
 from core.domain.models import GuessResult
 
 
@@ -39,12 +45,55 @@ class GameClient:
 
         self.base_url = effective_base.rstrip("/")
         self.timeout = effective_timeout
-        self.session = requests.Session()
 
-        # Set common headers
-        self.session.headers.update(
-            {"Content-Type": "application/json", "User-Agent": "Wordle-Bot/1.0"}
+        # requests.Session is not thread-safe (cookie jar and connection
+        # bookkeeping mutate without locking), and benchmark sweeps drive one
+        # shared client from a worker pool — so each thread lazily gets its
+        # own session; close() tears all of them down
+        self._tls = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        """Create a configured HTTP session for the calling thread."""
+        session = requests.Session()
+
+        # Size the connection pool for concurrent benchmark workers so
+        # parallel games reuse pooled connections instead of opening new ones.
+        # Transport retries cover connection setup only; response-level
+        # failures are retried by tenacity on the submit methods, so the two
+        # layers never stack
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=DEFAULT_MAX_WORKERS,
+            pool_maxsize=max(DEFAULT_MAX_WORKERS, TARGET_PROBE_MAX_WORKERS),
+            max_retries=requests.adapters.Retry(
+                connect=DEFAULT_API_RETRY_ATTEMPTS, backoff_factor=0.2
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # Set common headers; keep-alive keeps pooled TLS connections warm
+        # across the benchmark's back-to-back requests
+        session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "User-Agent": "Wordle-Bot/1.0",
+                "Connection": "keep-alive",
+            }
         )
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's HTTP session, created on first use."""
+        session: requests.Session | None = getattr(self._tls, "session", None)
+        if session is None:
+            session = self._build_session()
+            self._tls.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
 
     @retry(
         stop=stop_after_attempt(3),
@@ -95,6 +144,25 @@ class GameClient:
                 f"Invalid API response for daily guess '{guess}': {str(e)}"
             ) from e
 
+    def try_submit_guess(
+        self, guess: str
+    ) -> tuple[GuessResult | None, WordleAPIError | None]:
+        """Submit a daily guess, reporting failure via the return value.
+
+        Loop callers can stay free of per-iteration try/except blocks and
+        decide how to handle the error at one place.
+
+        Args:
+            guess: The 5-letter word to guess
+
+        Returns:
+            (result, None) on success, (None, error) on API failure
+        """
+        try:
+            return self.submit_guess(guess), None
+        except WordleAPIError as e:
+            return None, e
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=5),
@@ -236,6 +304,8 @@ class GameClient:
             raise WordleAPIError(f"Failed to get game status: {str(e)}") from e
 
     def close(self) -> None:
-        """Close the HTTP session and cleanup resources."""
-        if self.session:
-            self.session.close()
+        """Close all per-thread HTTP sessions and cleanup resources."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
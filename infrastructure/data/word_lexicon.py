@@ -3,6 +3,8 @@
 import random
 from pathlib import Path
 
+import numpy as np
+
 from core.domain.types import LexiconStats
 
 
@@ -21,8 +23,13 @@ class WordLexicon:
         if not self._initialized:
             self._answers: list[str] = []
             self._allowed_guesses: list[str] = []
-            self._answer_set: set[str] = set()
-            self._allowed_set: set[str] = set()
+            # Frozen because the word lists are immutable after load; keeps
+            # is_valid_answer/is_valid_guess O(1) membership checks
+            self._answer_set: frozenset[str] = frozenset()
+            self._allowed_set: frozenset[str] = frozenset()
+            self._answers_matrix: np.ndarray | None = None
+            self._answers_tuple: tuple[str, ...] | None = None
+            self._stats: LexiconStats
             self._load_word_lists()
             WordLexicon._initialized = True
 
@@ -42,7 +49,7 @@ class WordLexicon:
                 if line.strip() and len(line.strip()) == 5
             ]
 
-        self._answer_set = set(self._answers)
+        self._answer_set = frozenset(self._answers)
 
         # Load allowed guesses list (~12,972 words including answers)
         allowed_path = base_path / "allowed.txt"
@@ -56,7 +63,7 @@ class WordLexicon:
                 if line.strip() and len(line.strip()) == 5
             ]
 
-        self._allowed_set = set(self._allowed_guesses)
+        self._allowed_set = frozenset(self._allowed_guesses)
 
         # Validate data integrity
         if not self._answers:
@@ -70,11 +77,43 @@ class WordLexicon:
                 f"Allowed guesses ({len(self._allowed_guesses)}) should be >= answers ({len(self._answers)})"
             )
 
+        # Lists are immutable from here on, so the stats are final too;
+        # building them now keeps get_stats a plain attribute read
+        self._stats = {
+            "total_answers": len(self._answers),
+            "total_allowed_guesses": len(self._allowed_guesses),
+            "answers_in_allowed": len(self._answer_set.intersection(self._allowed_set)),
+        }
+
     @property
     def answers(self) -> list[str]:
         """Get list of possible answer words."""
         return self._answers.copy()
 
+    @property
+    def answers_matrix(self) -> np.ndarray:
+        """Answers encoded as a uint8 ASCII letter matrix of shape (N, 5).
+
+        Built once on first use and shared by vectorized solver paths so
+        repeated full-lexicon analyses skip re-encoding the word list.
+        """
+        if self._answers_matrix is None:
+            flat = np.frombuffer("".join(self._answers).encode("ascii"), dtype=np.uint8)
+            self._answers_matrix = flat.reshape(len(self._answers), 5)
+        return self._answers_matrix
+
+    @property
+    def answers_tuple(self) -> tuple[str, ...]:
+        """All answer words as an immutable snapshot, built once.
+
+        Full-lexicon solver calls key their memo on this tuple, so sharing
+        one instance makes repeat lookups hit the cache without rebuilding
+        or re-hashing a fresh key.
+        """
+        if self._answers_tuple is None:
+            self._answers_tuple = tuple(self._answers)
+        return self._answers_tuple
+
     @property
     def allowed_guesses(self) -> list[str]:
         """Get list of all allowed guess words."""
@@ -82,11 +121,13 @@ class WordLexicon:
 
     def is_valid_answer(self, word: str) -> bool:
         """Check if word is a valid answer."""
-        return word.upper() in self._answer_set
+        # Fast path for already-uppercased words avoids a string allocation
+        return word in self._answer_set or word.upper() in self._answer_set
 
     def is_valid_guess(self, word: str) -> bool:
         """Check if word is a valid guess."""
-        return word.upper() in self._allowed_set
+        # Fast path for already-uppercased words avoids a string allocation
+        return word in self._allowed_set or word.upper() in self._allowed_set
 
     def get_random_answer(self) -> str:
         """Get a random answer word."""
@@ -97,9 +138,9 @@ class WordLexicon:
         return self._answers.copy()
 
     def get_stats(self) -> LexiconStats:
-        """Get statistics about loaded word lists."""
-        return {
-            "total_answers": len(self._answers),
-            "total_allowed_guesses": len(self._allowed_guesses),
-            "answers_in_allowed": len(self._answer_set.intersection(self._allowed_set)),
-        }
+        """Get statistics about loaded word lists.
+
+        The word lists are immutable after load, so the stats dict is built
+        once at load time and shared; callers must treat it as read-only.
+        """
+        return self._stats
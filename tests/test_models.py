@@ -38,13 +38,13 @@ class TestGuessResult:
 
         # Mixed format
         result = GuessResult.from_api_response("CRANE", "+-ox-")
-        expected = [
+        expected = (
             FeedbackType.CORRECT,
             FeedbackType.ABSENT,
             FeedbackType.PRESENT,
             FeedbackType.ABSENT,
             FeedbackType.ABSENT,
-        ]
+        )
         assert result.feedback == expected
 
     def test_from_api_response_invalid(self):
@@ -1,10 +1,14 @@
 """Rich console display utilities for Wordle bot visualization."""
 
+import queue
+import threading
 import time
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 from core.domain.models import FeedbackType, GuessResult
+from utils.logging_config import get_logger
 
 
 class GameDisplay:
@@ -46,7 +50,8 @@ class GameDisplay:
         Args:
             game_id: Optional game identifier
         """
-        self.game_start_time = time.time()
+        # Monotonic start for duration display; wall clock only names the game
+        self.game_start_time = time.perf_counter()
         self.game_id = game_id or f"game_{int(time.time())}"
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -116,7 +121,7 @@ class GameDisplay:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         game_duration = (
-            time.time() - self.game_start_time if self.game_start_time else 0
+            time.perf_counter() - self.game_start_time if self.game_start_time else 0
         )
 
         print(
@@ -145,7 +150,7 @@ class GameDisplay:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         game_duration = (
-            time.time() - self.game_start_time if self.game_start_time else 0
+            time.perf_counter() - self.game_start_time if self.game_start_time else 0
         )
 
         print(
@@ -183,6 +188,87 @@ class GameDisplay:
         )
 
 
+class QueuedGameDisplay(GameDisplay):
+    """GameDisplay that renders from a background daemon thread.
+
+    Terminal rendering takes milliseconds per event; queueing the calls
+    lets solver compute overlap with console I/O. Events are drained in
+    submission order, and flush() blocks until everything has rendered.
+    """
+
+    def __init__(self, show_detailed: bool = True):
+        super().__init__(show_detailed=show_detailed)
+        self._queue: queue.Queue[
+            tuple[Callable[..., None], tuple[Any, ...], dict[str, Any]]
+        ] = queue.Queue()
+        self._worker = threading.Thread(target=self._drain, daemon=True)
+        self._worker.start()
+
+    def _drain(self) -> None:
+        """Render queued display events until the process exits.
+
+        A render failure (e.g. a broken stdout pipe) must not kill the
+        worker: later items would then never be task_done'd and flush()
+        would block forever. Log and keep draining instead.
+        """
+        logger = get_logger(__name__)
+        while True:
+            render, args, kwargs = self._queue.get()
+            try:
+                render(*args, **kwargs)
+            except Exception:
+                logger.exception("Display render failed for %s", render.__name__)
+            finally:
+                self._queue.task_done()
+
+    def _enqueue(self, render: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        self._queue.put((render, args, kwargs))
+
+    def flush(self) -> None:
+        """Block until all queued display events have been rendered."""
+        self._queue.join()
+
+    def print_header(self):
+        self._enqueue(super().print_header)
+
+    def start_new_game(self, game_id: str = None):
+        self._enqueue(super().start_new_game, game_id)
+
+    def show_guess_submission(
+        self,
+        turn: int,
+        guess: str,
+        remaining_count: int = None,
+        entropy: float = None,
+        calculation_time: float = None,
+    ):
+        self._enqueue(
+            super().show_guess_submission,
+            turn,
+            guess,
+            remaining_count,
+            entropy,
+            calculation_time,
+        )
+
+    def show_feedback(self, guess_result: GuessResult, remaining_count: int):
+        self._enqueue(super().show_feedback, guess_result, remaining_count)
+
+    def show_victory(self, total_guesses: int):
+        self._enqueue(super().show_victory, total_guesses)
+
+    def show_failure(self, total_guesses: int, target_word: str = None):
+        self._enqueue(super().show_failure, total_guesses, target_word)
+
+    def show_thinking(self, message: str):
+        self._enqueue(super().show_thinking, message)
+
+    def show_word_analysis(
+        self, word: str, entropy: float, patterns: int, remaining: int
+    ):
+        self._enqueue(super().show_word_analysis, word, entropy, patterns, remaining)
+
+
 class BenchmarkDisplay:
     """Handles benchmark results display."""
 
@@ -197,7 +283,7 @@ class BenchmarkDisplay:
         Args:
             total_games: Total number of games to play
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.total_games = total_games
         self.games_completed = 0
 
@@ -229,7 +315,7 @@ class BenchmarkDisplay:
         Args:
             results: Benchmark results dictionary
         """
-        total_time = time.time() - self.start_time if self.start_time else 0
+        total_time = time.perf_counter() - self.start_time if self.start_time else 0
 
         print("\n\n" + "=" * 50)
         print("📊 BENCHMARK REPORT")